@@ -23,21 +23,68 @@ Examples:
 """
 
 import argparse
+import errno
+import hashlib
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from assistant_skills_lib import (
     validate_required, validate_path,
     InputValidationError as ValidationError,
     print_success, print_error, print_info, print_warning, print_header
 )
 
+# ioctl request number for FICLONE from linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# errnos meaning the filesystem (or device pair) cannot reflink at all
+_NO_CLONE_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL})
+
+# Set after the first such failure; later copies go straight to copy2
+_clone_unsupported = False
+
+# Bump when the shape of analyze_project's result changes
+CACHE_SCHEMA = 2
+
+
+def _is_script(name: str) -> bool:
+    return name.endswith('.py') and name != '__init__.py'
+
+
+def _is_test(name: str) -> bool:
+    return name.startswith('test_') and name.endswith('.py')
+
 
-def analyze_project(project_path: Path) -> dict:
-    """Analyze existing project structure."""
+def _scan_files(directory: Path, match, collect_names: bool = True):
+    """Return names of matching files in a directory, or only their count."""
+    with os.scandir(directory) as entries:
+        names = (entry.name for entry in entries if match(entry.name))
+        if collect_names:
+            return list(names)
+        return sum(1 for _ in names)
+
+
+def _count(files) -> int:
+    """Return the number of files from a name list or a precomputed count."""
+    return files if isinstance(files, int) else len(files)
+
+
+def analyze_project(project_path: Path, collect_names: bool = True) -> dict:
+    """Analyze existing project structure.
+
+    When collect_names is False, per-skill 'scripts' and 'tests' hold file
+    counts instead of name lists.
+    """
     analysis = {
         'path': str(project_path),
         'structure': 'unknown',
@@ -45,22 +92,26 @@ def analyze_project(project_path: Path) -> dict:
         'skills': [],
         'has_shared_lib': False,
         'has_scripts': False,
-        'scripts': [],
+        'script_count': 0,
         'has_tests': False,
-        'tests': [],
+        'test_count': 0,
         'files_to_migrate': [],
         'warnings': [],
         'errors': []
     }
 
+    # One readdir of the project root answers every top-level presence check
+    with os.scandir(project_path) as entries:
+        top_level = {entry.name for entry in entries}
+
     # Check for old structure
     old_skills_dir = project_path / '.claude' / 'skills'
     new_skills_dir = project_path / 'skills'
 
-    if old_skills_dir.exists():
+    if '.claude' in top_level and old_skills_dir.is_dir():
         analysis['structure'] = 'old'
         skills_dir = old_skills_dir
-    elif new_skills_dir.exists():
+    elif 'skills' in top_level:
         analysis['structure'] = 'new'
         skills_dir = new_skills_dir
     else:
@@ -87,19 +138,17 @@ def analyze_project(project_path: Path) -> dict:
 
             # Count scripts
             if skill_info['has_scripts']:
-                scripts_dir = skill_dir / 'scripts'
-                py_files = [f.name for f in scripts_dir.glob('*.py') if f.name != '__init__.py']
+                py_files = _scan_files(skill_dir / 'scripts', _is_script, collect_names)
                 skill_info['scripts'] = py_files
                 analysis['has_scripts'] = True
-                analysis['scripts'].extend(py_files)
+                analysis['script_count'] += _count(py_files)
 
             # Count tests
             if skill_info['has_tests']:
-                tests_dir = skill_dir / 'tests'
-                test_files = [f.name for f in tests_dir.glob('test_*.py')]
+                test_files = _scan_files(skill_dir / 'tests', _is_test, collect_names)
                 skill_info['tests'] = test_files
                 analysis['has_tests'] = True
-                analysis['tests'].extend(test_files)
+                analysis['test_count'] += _count(test_files)
 
             analysis['skills'].append(skill_info)
 
@@ -111,15 +160,105 @@ def analyze_project(project_path: Path) -> dict:
             analysis['has_shared_lib'] = True
 
     # Check for existing new structure elements
-    if (project_path / '.claude-plugin').exists():
+    if '.claude-plugin' in top_level:
         analysis['warnings'].append('Project already has .claude-plugin/ directory')
 
-    if (project_path / 'VERSION').exists():
+    if 'VERSION' in top_level:
         analysis['warnings'].append('Project already has VERSION file')
 
     return analysis
 
 
+def _cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME or ~/.cache)."""
+    xdg_cache = os.environ.get('XDG_CACHE_HOME')
+    base = Path(xdg_cache) if xdg_cache and os.path.isabs(xdg_cache) else Path.home() / '.cache'
+    return base / 'assistant-builder'
+
+
+def _analysis_cache_path(project_path: Path) -> Path:
+    digest = hashlib.sha256(str(project_path).encode()).hexdigest()
+    return _cache_dir() / f'migrate-{digest}.json'
+
+
+def _read_cache(cache_file: Path) -> bytes:
+    """Read a cache file, refusing to follow a symlink in its place."""
+    fd = os.open(cache_file, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    with os.fdopen(fd, 'rb') as f:
+        return f.read()
+
+
+def _write_cache(cache_file: Path, data: bytes):
+    """Atomically replace a cache file without following symlinks.
+
+    The data goes to a freshly created (O_EXCL) temp file in the private
+    cache directory, which os.replace then renames over the cache file.
+    """
+    cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f'.{cache_file.name}.{os.getpid()}.tmp')
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_NOFOLLOW', 0)
+    fd = os.open(tmp_file, flags, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _analysis_fingerprint(project_path: Path) -> list:
+    """Collect mtimes of every directory whose contents analyze_project reads."""
+    def mtime(path: Path):
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    dirs = [project_path, project_path / '.claude']
+    for skills_dir in (project_path / '.claude' / 'skills', project_path / 'skills'):
+        dirs.append(skills_dir)
+        if not skills_dir.is_dir():
+            continue
+        with os.scandir(skills_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    skill_dir = Path(entry.path)
+                    dirs.extend([skill_dir, skill_dir / 'scripts', skill_dir / 'tests'])
+
+    return [[str(d), mtime(d)] for d in dirs]
+
+
+def load_analysis(project_path: Path, collect_names: bool = True, use_cache: bool = False) -> dict:
+    """Analyze a project, optionally reusing the cached result of an earlier run.
+
+    With use_cache, a --dry-run followed by the real migration skips the
+    second walk of the project tree. The cache lives in the per-user cache
+    directory and is invalidated when any directory analyze_project reads
+    changes.
+    """
+    if not use_cache:
+        return analyze_project(project_path, collect_names)
+
+    cache_file = _analysis_cache_path(project_path)
+    fingerprint = _analysis_fingerprint(project_path)
+    key = {'schema': CACHE_SCHEMA, 'collect_names': collect_names, 'fingerprint': fingerprint}
+
+    try:
+        cached = json.loads(_read_cache(cache_file))
+        if cached['key'] == key and cached['analysis']['path'] == str(project_path):
+            return cached['analysis']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    analysis = analyze_project(project_path, collect_names)
+    try:
+        _write_cache(cache_file, json.dumps({'key': key, 'analysis': analysis}).encode())
+    except OSError:
+        pass
+    return analysis
+
+
 def generate_migration_plan(analysis: dict) -> dict:
     """Generate a migration plan based on analysis."""
     plan = {
@@ -161,20 +300,15 @@ def generate_migration_plan(analysis: dict) -> dict:
         ('pytest.ini', None),
     ]
 
-    # Files/directories to move (if old structure)
+    # Directories to move (if old structure). The whole skills tree moves at
+    # once; execute_migration falls back to per-entry moves if skills/ exists.
     if analysis['structure'] == 'old':
-        for skill in analysis['skills']:
-            old_path = f".claude/skills/{skill['name']}"
-            new_path = f"skills/{skill['name']}"
-            plan['move_files'].append((old_path, new_path))
-
-        # Move shared
-        plan['move_files'].append(('.claude/skills/shared', 'skills/shared'))
+        plan['move_files'].append(('.claude/skills', 'skills'))
 
     # Manual steps
     if analysis['has_scripts']:
         plan['manual_steps'].append(
-            f"Extract {len(analysis['scripts'])} scripts to a separate library package"
+            f"Extract {analysis['script_count']} scripts to a separate library package"
         )
         plan['manual_steps'].append(
             "Update SKILL.md files to reference CLI commands instead of scripts"
@@ -182,12 +316,64 @@ def generate_migration_plan(analysis: dict) -> dict:
 
     if analysis['has_tests']:
         plan['manual_steps'].append(
-            f"Review and update {len(analysis['tests'])} test files for new structure"
+            f"Review and update {analysis['test_count']} test files for new structure"
         )
 
     return plan
 
 
+def _create_file(path: Path, content: str) -> bool:
+    """Create a new file, returning False if it already exists."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+def _clone_tree(src: Path, dst: Path) -> bool:
+    """Clone a whole directory tree in one call (APFS clonefile).
+
+    Returns False when the platform or filesystem cannot clone, in which
+    case the caller falls back to a per-file copy.
+    """
+    if sys.platform != 'darwin':
+        return False
+    try:
+        import ctypes
+        libc = ctypes.CDLL('/usr/lib/libSystem.dylib', use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def _clone_file(src, dst, *, follow_symlinks=True):
+    """copytree copy_function that reflinks files (btrfs/XFS) when possible.
+
+    The first failure showing reflinks are unsupported is remembered, so
+    the rest of the copy skips straight to copy2.
+    """
+    global _clone_unsupported
+    if fcntl is not None and sys.platform.startswith('linux') and not _clone_unsupported:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except OSError as e:
+            if e.errno in _NO_CLONE_ERRNOS:
+                _clone_unsupported = True
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def _copy_tree(src: Path, dst: Path):
+    """Copy a project tree, using copy-on-write clones where supported."""
+    if not _clone_tree(src, dst):
+        shutil.copytree(src, dst, copy_function=_clone_file)
+
+
 def execute_migration(
     project_path: Path,
     output_path: Path,
@@ -215,7 +401,7 @@ def execute_migration(
     if project_path == output_path and not dry_run:
         backup_path = project_path.parent / f"{project_path.name}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         try:
-            shutil.copytree(project_path, backup_path)
+            _copy_tree(project_path, backup_path)
             result['backup_path'] = str(backup_path)
         except Exception as e:
             result['warnings'].append(f"Could not create backup: {e}")
@@ -226,33 +412,58 @@ def execute_migration(
             result['success'] = False
             result['errors'].append(f"Output directory already exists: {output_path}")
             return result
-        shutil.copytree(project_path, output_path)
+        _copy_tree(project_path, output_path)
 
     target_path = output_path
 
-    # Create directories
-    for dir_path in plan['create_directories']:
-        full_path = target_path / dir_path
-        if not full_path.exists():
-            if not dry_run:
-                full_path.mkdir(parents=True, exist_ok=True)
-            result['created_directories'].append(dir_path)
-
-    # Move files (for old structure)
+    # Move files (for old structure) before creating directories, so a
+    # whole-tree move can land on a not-yet-existing destination
     for old_path, new_path in plan['move_files']:
         old_full = target_path / old_path
         new_full = target_path / new_path
 
-        if old_full.exists() and not new_full.exists():
+        if not old_full.exists():
+            continue
+
+        if not new_full.exists():
             if not dry_run:
                 shutil.move(str(old_full), str(new_full))
             result['moved_files'].append((old_path, new_path))
+        elif old_full.is_dir():
+            # Destination already exists: move entries that do not collide
+            for entry in sorted(old_full.iterdir()):
+                if not (new_full / entry.name).exists():
+                    if not dry_run:
+                        shutil.move(str(entry), str(new_full / entry.name))
+                    result['moved_files'].append(
+                        (f"{old_path}/{entry.name}", f"{new_path}/{entry.name}")
+                    )
+
+    def exists_after_moves(rel_path: str) -> bool:
+        if (target_path / rel_path).exists():
+            return True
+        if not dry_run:
+            return False
+        # Dry runs did not move anything, so look where the move would come from
+        for old_path, new_path in result['moved_files']:
+            if rel_path == new_path or rel_path.startswith(new_path + '/'):
+                return (target_path / old_path / rel_path[len(new_path):].lstrip('/')).exists()
+        return False
+
+    # Create directories
+    for dir_path in plan['create_directories']:
+        if not exists_after_moves(dir_path):
+            if not dry_run:
+                (target_path / dir_path).mkdir(parents=True, exist_ok=True)
+            result['created_directories'].append(dir_path)
 
-    # Create files
+    # Create files: generate contents serially, then write them in parallel
+    pending = []
     for file_path, content in plan['create_files']:
         full_path = target_path / file_path
 
-        if full_path.exists():
+        # Real runs detect existing files via O_EXCL at write time
+        if dry_run and full_path.exists():
             result['warnings'].append(f"Skipping existing file: {file_path}")
             continue
 
@@ -278,10 +489,24 @@ def execute_migration(
                 content = generate_pytest_ini(topic)
 
         if content is not None:
-            if not dry_run:
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                full_path.write_text(content)
-            result['created_files'].append(file_path)
+            pending.append((file_path, full_path, content))
+
+    if dry_run:
+        result['created_files'].extend(file_path for file_path, _, _ in pending)
+    elif pending:
+        for parent in {full_path.parent for _, full_path, _ in pending}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # Writes are independent; overlap their syscall latency
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            created = executor.map(
+                lambda item: _create_file(item[1], item[2]), pending
+            )
+            for (file_path, _, _), was_created in zip(pending, created):
+                if was_created:
+                    result['created_files'].append(file_path)
+                else:
+                    result['warnings'].append(f"Skipping existing file: {file_path}")
 
     # Clean up old structure if migrating in place
     if analysis['structure'] == 'old' and project_path == output_path:
@@ -296,34 +521,49 @@ def execute_migration(
     return result
 
 
+def _json_string_list(items: list, indent: str = '  ') -> str:
+    """Render a list of strings exactly as json.dumps(..., indent=2) would."""
+    if not items:
+        return '[]'
+    inner = f',\n{indent}  '.join(json.dumps(item) for item in items)
+    return f'[\n{indent}  {inner}\n{indent}]'
+
+
+# plugin.json and marketplace.json have a fixed shape, so they are rendered
+# from templates with json.dumps used only to escape individual strings.
 def generate_plugin_json(topic: str, analysis: dict) -> str:
     """Generate plugin.json content."""
     skills = [f"../skills/{s['name']}/SKILL.md" for s in analysis['skills']]
+    name = json.dumps(f"{topic}-assistant-skills")
+    description = json.dumps(f"Claude Code skills for {topic.title()} automation")
 
-    plugin = {
-        "name": f"{topic}-assistant-skills",
-        "version": "1.0.0",
-        "description": f"Claude Code skills for {topic.title()} automation",
-        "skills": skills,
-        "commands": ["./commands/*.md"]
-    }
-
-    return json.dumps(plugin, indent=2)
+    return f"""{{
+  "name": {name},
+  "version": "1.0.0",
+  "description": {description},
+  "skills": {_json_string_list(skills)},
+  "commands": [
+    "./commands/*.md"
+  ]
+}}"""
 
 
 def generate_marketplace_json(topic: str, analysis: dict) -> str:
     """Generate marketplace.json content."""
-    marketplace = {
-        "name": f"{topic}-assistant-skills",
-        "version": "1.0.0",
-        "plugins": [{
-            "name": f"{topic}-assistant-skills",
-            "source": "./",
-            "description": f"{topic.title()} automation skills for Claude Code"
-        }]
-    }
-
-    return json.dumps(marketplace, indent=2)
+    name = json.dumps(f"{topic}-assistant-skills")
+    description = json.dumps(f"{topic.title()} automation skills for Claude Code")
+
+    return f"""{{
+  "name": {name},
+  "version": "1.0.0",
+  "plugins": [
+    {{
+      "name": {name},
+      "source": "./",
+      "description": {description}
+    }}
+  ]
+}}"""
 
 
 def generate_setup_command(topic: str) -> str:
@@ -515,8 +755,10 @@ def print_analysis(analysis: dict):
     if analysis['skills']:
         print("\nSkills found:")
         for skill in analysis['skills']:
-            scripts = f", {len(skill['scripts'])} scripts" if skill['scripts'] else ""
-            tests = f", {len(skill['tests'])} tests" if skill['tests'] else ""
+            script_count = _count(skill['scripts'])
+            test_count = _count(skill['tests'])
+            scripts = f", {script_count} scripts" if script_count else ""
+            tests = f", {test_count} tests" if test_count else ""
             print(f"  - {skill['name']}{scripts}{tests}")
 
     print(f"\nHas shared library: {'Yes' if analysis['has_shared_lib'] else 'No'}")
@@ -619,6 +861,8 @@ Examples:
                         help='Preview without making changes')
     parser.add_argument('--report-only', '-r', action='store_true',
                         help='Generate analysis report only')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse the analysis from an earlier run (e.g. a --dry-run) if unchanged')
 
     args = parser.parse_args()
 
@@ -632,7 +876,11 @@ Examples:
 
         # Analyze
         print_info("Analyzing project...\n")
-        analysis = analyze_project(project_path)
+        analysis = load_analysis(
+            project_path,
+            collect_names=not args.report_only,
+            use_cache=args.cache
+        )
         print_analysis(analysis)
 
         if analysis['errors']:
@@ -640,7 +888,7 @@ Examples:
             sys.exit(1)
 
         if args.report_only:
-            sys.exit(0)
+            return
 
         # Generate plan
         print()
@@ -649,7 +897,7 @@ Examples:
 
         if args.dry_run:
             print_info("\nDRY RUN - No changes made")
-            sys.exit(0)
+            return
 
         # Confirm
         print()
@@ -660,7 +908,7 @@ Examples:
 
         if confirm != 'y':
             print("Cancelled.")
-            sys.exit(0)
+            return
 
         # Execute
         print_info("\nExecuting migration...\n")
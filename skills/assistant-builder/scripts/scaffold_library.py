@@ -32,10 +32,12 @@ Examples:
 """
 
 import argparse
-import json
+import os
+import re
 import sys
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 
 from assistant_skills_lib import (
     validate_required, validate_name, validate_topic_prefix,
@@ -46,27 +48,121 @@ from assistant_skills_lib import (
 
 
 # Authentication methods
-AUTH_METHODS = ['api_key', 'oauth', 'jwt', 'basic']
+AUTH_METHODS = ('api_key', 'oauth', 'jwt', 'basic')
+_AUTH_METHODS_SET = frozenset(AUTH_METHODS)
 
+# Single-pass name transforms
+_DROP_SEPARATORS = str.maketrans('', '', '-_')
+_DASH_TO_UNDERSCORE = str.maketrans('-', '_')
+_ENV_SEPARATORS = str.maketrans(' -', '__')
+_LIB_SUFFIX_RE = re.compile(r'-(?:assistant-skills-lib|lib)$')
 
-def generate_pyproject_toml(context: dict) -> str:
-    """Generate pyproject.toml."""
-    name = context['LIB_NAME']
+
+def _default_topic(lib_name: str) -> str:
+    """Derive a topic from a library name by dropping its -lib suffix."""
+    return _LIB_SUFFIX_RE.sub('', lib_name)
+
+
+def _enrich(context: dict) -> dict:
+    """
+    Add the derived names referenced by the templates to context.
+
+    Called once when the context is built so every generator is a plain
+    lookup. Existing keys are left untouched. PKG_NAME and PKG_PATH are both
+    the package directory name; CLASS_PREFIX prefixes the generated classes.
+    """
     topic = context['TOPIC']
     api_name = context['API_NAME']
-    cli_name = context.get('CLI_NAME', f'{topic}-as')
-    pkg_name = topic.replace('-', '_') + '_assistant_skills_lib'
 
-    return f'''[project]
-name = "{name}"
+    if '-' in topic or '_' in topic:
+        # title() breaks words at '-' and '_' alike, so the separators can be dropped after it
+        class_prefix = topic.title().translate(_DROP_SEPARATORS)
+        pkg_dir = topic.translate(_DASH_TO_UNDERSCORE)
+    else:
+        # Validated topics are plain [a-z0-9]; nothing to strip or translate
+        class_prefix = topic.title()
+        pkg_dir = topic
+
+    context.setdefault('CLASS_PREFIX', class_prefix)
+    context.setdefault('PKG_NAME', pkg_dir + '_assistant_skills_lib')
+    context.setdefault('PKG_PATH', context['PKG_NAME'])
+    context.setdefault('ENV_PREFIX', api_name.upper().translate(_ENV_SEPARATORS))
+    context.setdefault('CLI_NAME', f'{topic}-as')
+    context.setdefault('API_URL', 'https://api.example.com')
+    context.setdefault('AUTHOR', 'Your Name')
+    context.setdefault('EMAIL', 'your@email.com')
+    context.setdefault(
+        'AUTH_HEADER',
+        'f"Basic {self.api_key}"' if context.get('AUTH_METHOD') == 'basic' else 'f"Bearer {self.api_key}"'
+    )
+    return context
+
+
+def _resolve(context: dict) -> dict:
+    """
+    Return context with the derived names the templates use filled in.
+
+    scaffold_library enriches its context once when it builds it, so that
+    context is returned as is; other callers get an enriched copy.
+    """
+    if 'CLASS_PREFIX' in context:
+        return context
+    return _enrich(dict(context))
+
+
+# Generated file bodies are module-level templates written with the
+# {{PLACEHOLDER}} syntax of assistant_skills_lib.render_template, so emitted
+# code needs no brace escaping. _compile converts each one to str.format_map
+# form once at import, and _render memoizes the result per set of values.
+_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+
+
+def _compile(template: str) -> str:
+    """Convert a {{PLACEHOLDER}} template to a str.format_map template."""
+    parts = _PLACEHOLDER.split(template)
+    parts[::2] = [text.replace('{', '{{').replace('}', '}}') for text in parts[::2]]
+    parts[1::2] = ['{' + name + '}' for name in parts[1::2]]
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def _fields(template: str) -> tuple:
+    """Return the placeholder names used by a compiled template."""
+    return tuple(sorted({name for _, name, _, _ in Formatter().parse(template) if name}))
+
+
+@lru_cache(maxsize=256)
+def _format(template: str, values: tuple) -> str:
+    """Fill a compiled template from (name, value) pairs."""
+    return template.format_map(dict(values))
+
+
+def _render(template: str, context: dict) -> str:
+    """Render a compiled template, memoized on the context values it uses."""
+    return _format(template, tuple((name, context[name]) for name in _fields(template)))
+
+
+def clear_template_caches():
+    """
+    Drop every memoized render and derived context.
+
+    Renders are kept in a bounded cache; long-running callers that scaffold
+    many distinct libraries can call this to release it early.
+    """
+    for cached in (_fields, _format, _base_context):
+        cached.cache_clear()
+
+
+_PYPROJECT_TOML_TEMPLATE = _compile('''[project]
+name = "{{LIB_NAME}}"
 version = "0.1.0"
-description = "CLI library for {api_name} automation"
+description = "CLI library for {{API_NAME}} automation"
 readme = "README.md"
 requires-python = ">=3.9"
-license = {{text = "MIT"}}
+license = {text = "MIT"}
 
 authors = [
-    {{name = "{context.get('AUTHOR', 'Your Name')}", email = "{context.get('EMAIL', 'your@email.com')}"}}
+    {name = "{{AUTHOR}}", email = "{{EMAIL}}"}
 ]
 
 classifiers = [
@@ -82,6 +178,7 @@ classifiers = [
 
 dependencies = [
     "requests>=2.28.0",
+    "urllib3>=1.26",  # Retry(allowed_methods=...)
     "click>=8.0",
     "tabulate>=0.9.0",
     "colorama>=0.4.6",
@@ -96,9 +193,15 @@ dev = [
     "ruff>=0.1.0",
     "mypy>=1.0",
 ]
+perf = [
+    "orjson>=3.0",
+]
+http2 = [
+    "httpx[http2]>=0.23",
+]
 
 [project.scripts]
-{cli_name} = "{pkg_name}.cli.main:cli"
+{{CLI_NAME}} = "{{PKG_PATH}}.cli.main:cli"
 
 [build-system]
 requires = ["setuptools>=61.0"]
@@ -123,23 +226,22 @@ warn_unused_configs = true
 [tool.pytest.ini_options]
 testpaths = ["tests"]
 addopts = "-v --tb=short"
-'''
+''')
 
 
-def generate_readme(context: dict) -> str:
-    """Generate README.md."""
-    name = context['LIB_NAME']
-    api_name = context['API_NAME']
-    cli_name = context.get('CLI_NAME', f"{context['TOPIC']}-as")
+def generate_pyproject_toml(context: dict) -> str:
+    """Generate pyproject.toml."""
+    return _render(_PYPROJECT_TOML_TEMPLATE, _resolve(context))
 
-    return f'''# {name}
 
-CLI library for {api_name} automation.
+_README_TEMPLATE = _compile('''# {{LIB_NAME}}
+
+CLI library for {{API_NAME}} automation.
 
 ## Installation
 
 ```bash
-pip install {name}
+pip install {{LIB_NAME}}
 ```
 
 Or install from source:
@@ -155,44 +257,56 @@ pip install -e .
 Set your API credentials:
 
 ```bash
-export {api_name.upper().replace(' ', '_').replace('-', '_')}_API_KEY="your-api-key"
-export {api_name.upper().replace(' ', '_').replace('-', '_')}_BASE_URL="{context.get('API_URL', 'https://api.example.com')}"
+export {{ENV_PREFIX}}_API_KEY="your-api-key"
+export {{ENV_PREFIX}}_BASE_URL="{{API_URL}}"
 ```
 
 Or configure via CLI:
 
 ```bash
-{cli_name} config set api_key YOUR_API_KEY
-{cli_name} config set base_url https://api.example.com
+{{CLI_NAME}} config set api_key YOUR_API_KEY
+{{CLI_NAME}} config set base_url https://api.example.com
 ```
 
 ### Basic Usage
 
 ```bash
 # Check authentication
-{cli_name} auth status
+{{CLI_NAME}} auth status
 
 # List resources
-{cli_name} resource list
+{{CLI_NAME}} resource list
 
 # Get resource details
-{cli_name} resource get RESOURCE-123
+{{CLI_NAME}} resource get RESOURCE-123
 
 # Create resource
-{cli_name} resource create --name "New Resource"
+{{CLI_NAME}} resource create --name "New Resource"
 ```
 
 ### Output Formats
 
 ```bash
 # Table output (default)
-{cli_name} resource list
+{{CLI_NAME}} resource list
 
 # JSON output
-{cli_name} resource list --output json
+{{CLI_NAME}} resource list --output json
 
 # Text output
-{cli_name} resource list --output text
+{{CLI_NAME}} resource list --output text
+```
+
+### Bulk Operations
+
+Batch helpers send one request per chunk of items instead of one per item:
+
+```python
+from {{PKG_PATH}} import {{CLASS_PREFIX}}Client
+
+with {{CLASS_PREFIX}}Client() as client:
+    created = client.post_batch("/resources/bulk", [{"name": "a"}, {"name": "b"}], chunk=100)
+    client.delete_batch("/resources/bulk", [r["id"] for r in created])
 ```
 
 ### Profiles
@@ -201,10 +315,10 @@ Use different profiles for different environments:
 
 ```bash
 # Set up development profile
-{cli_name} --profile development config set base_url https://dev.api.example.com
+{{CLI_NAME}} --profile development config set base_url https://dev.api.example.com
 
 # Use development profile
-{cli_name} --profile development resource list
+{{CLI_NAME}} --profile development resource list
 ```
 
 ## Development
@@ -232,26 +346,25 @@ mypy src/
 ## License
 
 MIT License
-'''
+''')
 
 
-def generate_init_py(context: dict) -> str:
-    """Generate __init__.py for the package."""
-    api_name = context['API_NAME']
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
+def generate_readme(context: dict) -> str:
+    """Generate README.md."""
+    return _render(_README_TEMPLATE, _resolve(context))
 
-    return f'''"""
-{api_name} CLI Library
 
-Provides CLI tools and Python API for {api_name} automation.
+_INIT_PY_TEMPLATE = _compile('''"""
+{{API_NAME}} CLI Library
+
+Provides CLI tools and Python API for {{API_NAME}} automation.
 """
 
 __version__ = "0.1.0"
 
-from .client import {pkg_name}Client
 from .config_manager import ConfigManager
 from .error_handler import (
-    {pkg_name}Error,
+    {{CLASS_PREFIX}}Error,
     AuthenticationError,
     PermissionError,
     NotFoundError,
@@ -277,11 +390,11 @@ __all__ = [
     # Version
     "__version__",
     # Client
-    "{pkg_name}Client",
+    "{{CLASS_PREFIX}}Client",
     # Config
     "ConfigManager",
     # Errors
-    "{pkg_name}Error",
+    "{{CLASS_PREFIX}}Error",
     "AuthenticationError",
     "PermissionError",
     "NotFoundError",
@@ -300,34 +413,78 @@ __all__ = [
     "format_text",
     "OutputFormatter",
 ]
-'''
 
 
-def generate_client_py(context: dict) -> str:
-    """Generate client.py HTTP client."""
-    api_name = context['API_NAME']
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
-    auth_method = context.get('AUTH_METHOD', 'api_key')
+def __getattr__(name):
+    # The client pulls in requests; import it on first access
+    if name == "{{CLASS_PREFIX}}Client":
+        from .client import {{CLASS_PREFIX}}Client
+        return {{CLASS_PREFIX}}Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+''')
 
-    auth_header = 'f"Bearer {self.api_key}"' if auth_method != 'basic' else 'f"Basic {self.api_key}"'
 
-    return f'''"""HTTP client for {api_name} API."""
+def generate_init_py(context: dict) -> str:
+    """Generate __init__.py for the package."""
+    return _render(_INIT_PY_TEMPLATE, _resolve(context))
+
+
+_CLIENT_PY_TEMPLATE = _compile('''"""HTTP client for {{API_NAME}} API."""
 
 import requests
-from typing import Any, Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Dict, Iterator, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .config_manager import ConfigManager
 from .error_handler import handle_api_error, AuthenticationError
 
+# Transient failures are retried with backoff on idempotent methods only;
+# POST and PATCH are never replayed. Once retries are exhausted the last
+# response is returned so handle_api_error can map it.
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]),
+    raise_on_status=False,
+)
+
+# (results, total) from one page, by response shape. Each getter raises
+# KeyError or TypeError for a page of another shape (list.__len__ rejects
+# anything but a list).
+PAGE_GETTERS = {
+    "list": lambda r: (r, list.__len__(r)),
+    "items": lambda r: (r["items"], r.get("total", len(r["items"]))),
+    "data": lambda r: (r["data"], r.get("total", len(r["data"]))),
+}
+
+
+def _page_shape(response: Any) -> Optional[str]:
+    """Return the PAGE_GETTERS key for a page, or None if it has no results."""
+    if isinstance(response, list):
+        return "list"
+    if not isinstance(response, dict):
+        return None
+    if "items" in response:
+        return "items"
+    if "data" in response:
+        return "data"
+    return None
+
 
-class {pkg_name}Client:
+class {{CLASS_PREFIX}}Client:
     """HTTP client with automatic retry and error handling."""
 
+    __slots__ = ("base_url", "api_key", "timeout", "http2", "session", "_base", "_page_shapes")
+
     def __init__(
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         profile: str = "default",
         timeout: int = 30,
+        http2: bool = False,
     ):
         """
         Initialize the client.
@@ -337,29 +494,65 @@ class {pkg_name}Client:
             api_key: API key (overrides config)
             profile: Configuration profile name
             timeout: Request timeout in seconds
+            http2: Use an httpx HTTP/2 session (pip install ".[http2]")
         """
         config = ConfigManager()
         self.base_url = base_url or config.get("base_url", profile=profile)
         self.api_key = api_key or config.get("api_key", profile=profile)
         self.timeout = timeout
+        self.http2 = http2
 
         if not self.base_url:
             raise AuthenticationError(
                 "Base URL not configured. "
-                "Set {api_name.upper().replace(' ', '_').replace('-', '_')}_BASE_URL or run config command."
+                "Set {{ENV_PREFIX}}_BASE_URL or run config command."
             )
         if not self.api_key:
             raise AuthenticationError(
                 "API key not configured. "
-                "Set {api_name.upper().replace(' ', '_').replace('-', '_')}_API_KEY or run config command."
+                "Set {{ENV_PREFIX}}_API_KEY or run config command."
             )
 
-        self.session = requests.Session()
-        self.session.headers.update({{
-            "Authorization": {auth_header},
+        # Joined with each endpoint in _request
+        self._base = self.base_url.rstrip("/")
+        # Response shape per paginated endpoint, detected on its first page
+        self._page_shapes: Dict[str, str] = {}
+
+        self.session = self._create_session()
+        self.session.headers.update({
+            "Authorization": {{AUTH_HEADER}},
             "Content-Type": "application/json",
             "Accept": "application/json",
-        }})
+        })
+
+    def _create_session(self):
+        """
+        Create the HTTP session.
+
+        Returns:
+            requests.Session with pooled, retrying connections, or an
+            httpx.Client multiplexing requests over HTTP/2 when http2 is set
+            (httpx retries failed connections only, not error statuses)
+        """
+        if self.http2:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    'HTTP/2 support requires httpx: pip install "{{LIB_NAME}}[http2]"'
+                ) from None
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+            return httpx.Client(transport=transport, follow_redirects=True)
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -430,6 +623,52 @@ class {pkg_name}Client:
         """
         return self._request("DELETE", endpoint, **kwargs)
 
+    def post_batch(
+        self,
+        endpoint: str,
+        items: List[Dict],
+        chunk: int = 100,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many items with one POST per chunk.
+
+        Args:
+            endpoint: API bulk endpoint
+            items: Request bodies to create
+            chunk: Maximum items per request
+            **kwargs: Additional request arguments
+
+        Returns:
+            Created items from all chunks
+        """
+        created = []
+        for i in range(0, len(items), chunk):
+            response = self._request("POST", endpoint, json={"items": items[i:i + chunk]}, **kwargs)
+            if isinstance(response, dict):
+                response = response.get('items', response.get('data', []))
+            created.extend(response or [])
+        return created
+
+    def delete_batch(
+        self,
+        endpoint: str,
+        ids: List[str],
+        chunk: int = 100,
+        **kwargs
+    ) -> None:
+        """
+        Delete many items with one DELETE per chunk (?ids=a,b,c).
+
+        Args:
+            endpoint: API bulk endpoint
+            ids: Identifiers to delete
+            chunk: Maximum identifiers per request
+            **kwargs: Additional request arguments
+        """
+        for i in range(0, len(ids), chunk):
+            self._request("DELETE", endpoint, params={"ids": ",".join(ids[i:i + chunk])}, **kwargs)
+
     def _request(
         self,
         method: str,
@@ -447,15 +686,16 @@ class {pkg_name}Client:
         Returns:
             Response JSON data or None
         """
-        url = f"{{self.base_url.rstrip('/')}}/{{endpoint.lstrip('/')}}"
-
-        # Set timeout if not provided
-        if 'timeout' not in kwargs:
-            kwargs['timeout'] = self.timeout
+        if endpoint.startswith("/"):
+            url = self._base + endpoint
+        else:
+            url = self._base + "/" + endpoint
+        kwargs.setdefault("timeout", self.timeout)
 
         response = self.session.request(method, url, **kwargs)
 
-        if not response.ok:
+        failed = response.is_error if self.http2 else not response.ok
+        if failed:
             handle_api_error(response)
 
         # Handle empty responses
@@ -464,15 +704,17 @@ class {pkg_name}Client:
 
         return response.json()
 
-    def paginate(
+    def paginate_iter(
         self,
         endpoint: str,
         params: Optional[Dict] = None,
         page_size: int = 100,
         max_pages: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Paginate through all results.
+        Yield results page by page without holding the full result set.
+
+        The next page is requested while the caller consumes the current one.
 
         Args:
             endpoint: API endpoint
@@ -480,40 +722,67 @@ class {pkg_name}Client:
             page_size: Results per page
             max_pages: Maximum pages to fetch (None for all)
 
-        Returns:
-            List of all results
+        Yields:
+            Individual results
         """
-        params = params or {{}}
+        params = dict(params or {})
         params['limit'] = page_size
-        params['offset'] = 0
-
-        all_results = []
-        page = 0
 
-        while True:
-            if max_pages and page >= max_pages:
-                break
+        def fetch(offset: int) -> Any:
+            return self.get(endpoint, params={**params, 'offset': offset})
 
-            response = self.get(endpoint, params=params)
+        fetched = 0
+        page = 0
 
-            # Handle different response formats
-            if isinstance(response, list):
-                results = response
-                total = len(results)
-            else:
-                results = response.get('items', response.get('data', []))
-                total = response.get('total', len(results))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(fetch, 0)
 
-            all_results.extend(results)
+            try:
+                while pending is not None:
+                    response = pending.result()
+                    pending = None
+                    page += 1
+
+                    try:
+                        results, total = PAGE_GETTERS[self._page_shapes[endpoint]](response)
+                    except (KeyError, TypeError):
+                        # First page, or the endpoint changed envelope
+                        shape = _page_shape(response)
+                        if shape is None:
+                            break
+                        self._page_shapes[endpoint] = shape
+                        results, total = PAGE_GETTERS[shape](response)
+
+                    # Request the next page before yielding this one
+                    fetched += len(results)
+                    if results and fetched < total and not (max_pages and page >= max_pages):
+                        pending = pool.submit(fetch, page * page_size)
+
+                    yield from results
+            finally:
+                if pending is not None:
+                    pending.cancel()
 
-            # Check if we have all results
-            if len(all_results) >= total or not results:
-                break
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        page_size: int = 100,
+        max_pages: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Paginate through all results.
 
-            params['offset'] += page_size
-            page += 1
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            page_size: Results per page
+            max_pages: Maximum pages to fetch (None for all)
 
-        return all_results
+        Returns:
+            List of all results
+        """
+        return list(self.paginate_iter(endpoint, params, page_size, max_pages))
 
     def close(self):
         """Close the session."""
@@ -524,20 +793,23 @@ class {pkg_name}Client:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
-'''
+''')
 
 
-def generate_config_manager_py(context: dict) -> str:
-    """Generate config_manager.py."""
-    api_name = context['API_NAME']
-    env_prefix = api_name.upper().replace(' ', '_').replace('-', '_')
+def generate_client_py(context: dict) -> str:
+    """Generate client.py HTTP client."""
+    return _render(_CLIENT_PY_TEMPLATE, _resolve(context))
+
 
-    return f'''"""Configuration management for {api_name} CLI."""
+_CONFIG_MANAGER_PY_TEMPLATE = _compile('''"""Configuration management for {{API_NAME}} CLI."""
 
 import os
 import json
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Tuple
+
+# Parsed config files by path, with the (mtime_ns, size) they were read at
+_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
 
 
 class ConfigManager:
@@ -546,33 +818,77 @@ class ConfigManager:
     1. Environment variables
     2. Profile-specific config file
     3. Default config file
+
+    set() and delete() write the file immediately. Inside a ``with`` block
+    changes are held and written once on exit:
+
+        with ConfigManager() as config:
+            config.set("api_key", key)
+            config.set("base_url", url)
     """
 
+    __slots__ = ("config_dir", "config_file", "_config", "_dirty", "_autosave")
+
     def __init__(self, config_dir: Optional[Path] = None):
         """
         Initialize config manager.
 
         Args:
-            config_dir: Custom config directory (default: ~/.{context['TOPIC']})
+            config_dir: Custom config directory (default: ~/.{{TOPIC}})
         """
-        self.config_dir = config_dir or Path.home() / ".{context['TOPIC']}"
+        self.config_dir = config_dir or Path.home() / ".{{TOPIC}}"
         self.config_file = self.config_dir / "config.json"
-        self._config: Dict[str, Dict[str, Any]] = {{}
+        self._config: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._autosave = True
 
         self._load_config()
 
+    def __enter__(self):
+        self._autosave = False
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._autosave = True
+        self.flush()
+
     def _load_config(self):
-        """Load configuration from file."""
-        if self.config_file.exists():
-            try:
-                self._config = json.loads(self.config_file.read_text())
-            except Exception:
-                self._config = {{}}
+        """Load configuration from file, reusing the parse while it is unchanged."""
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        try:
+            cached = _CACHE.get(self.config_file)
+            if cached is not None and cached[0] == stamp:
+                data = cached[1]
+            else:
+                data = json.loads(self.config_file.read_bytes())
+                _CACHE[self.config_file] = (stamp, data)
+            # Each manager edits its own copy of the profile dicts
+            self._config = {profile: dict(values) for profile, values in data.items()}
+        except Exception:
+            self._config = {}
 
     def _save_config(self):
         """Save configuration to file."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file.write_text(json.dumps(self._config, indent=2))
+        _CACHE.pop(self.config_file, None)
+        self._dirty = False
+
+    def _changed(self):
+        """Record a change and save it unless writes are being batched."""
+        self._dirty = True
+        if self._autosave:
+            self._save_config()
+
+    def flush(self):
+        """Write pending changes to the config file."""
+        if self._dirty:
+            self._save_config()
 
     def get(
         self,
@@ -584,7 +900,7 @@ class ConfigManager:
         Get configuration value.
 
         Priority:
-        1. Environment variable ({env_prefix}_{{KEY}})
+        1. Environment variable ({{ENV_PREFIX}}_{KEY})
         2. Profile-specific value
         3. Default value
 
@@ -597,19 +913,19 @@ class ConfigManager:
             Configuration value
         """
         # Check environment variable first
-        env_key = f"{env_prefix}_{{key.upper()}}"
+        env_key = f"{{ENV_PREFIX}}_{key.upper()}"
         env_value = os.environ.get(env_key)
         if env_value is not None:
             return env_value
 
         # Check profile config
-        profile_config = self._config.get(profile, {{}})
+        profile_config = self._config.get(profile, {})
         if key in profile_config:
             return profile_config[key]
 
         # Check default profile
         if profile != "default":
-            default_config = self._config.get("default", {{}})
+            default_config = self._config.get("default", {})
             if key in default_config:
                 return default_config[key]
 
@@ -625,10 +941,10 @@ class ConfigManager:
             profile: Profile name
         """
         if profile not in self._config:
-            self._config[profile] = {{}}
+            self._config[profile] = {}
 
         self._config[profile][key] = value
-        self._save_config()
+        self._changed()
 
     def delete(self, key: str, profile: str = "default") -> bool:
         """
@@ -643,7 +959,7 @@ class ConfigManager:
         """
         if profile in self._config and key in self._config[profile]:
             del self._config[profile][key]
-            self._save_config()
+            self._changed()
             return True
         return False
 
@@ -653,52 +969,59 @@ class ConfigManager:
 
     def get_profile(self, profile: str = "default") -> Dict[str, Any]:
         """Get all values for a profile."""
-        return self._config.get(profile, {{}}).copy()
-'''
+        return self._config.get(profile, {}).copy()
+''')
 
 
-def generate_error_handler_py(context: dict) -> str:
-    """Generate error_handler.py."""
-    api_name = context['API_NAME']
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
+def generate_config_manager_py(context: dict) -> str:
+    """Generate config_manager.py."""
+    return _render(_CONFIG_MANAGER_PY_TEMPLATE, _resolve(context))
+
 
-    return f'''"""Exception hierarchy for {api_name} CLI."""
+_ERROR_HANDLER_PY_TEMPLATE = _compile('''"""Exception hierarchy for {{API_NAME}} CLI."""
 
 from functools import wraps
 import click
 
+# ANSI colors for CLI messages; click.echo strips them when the stream is
+# not a terminal and translates them on Windows.
+RED = "\\x1b[31m"
+GREEN = "\\x1b[32m"
+YELLOW = "\\x1b[33m"
+RESET = "\\x1b[0m"
 
-class {pkg_name}Error(Exception):
-    """Base exception for all {api_name} errors."""
+
+class {{CLASS_PREFIX}}Error(Exception):
+    """Base exception for all {{API_NAME}} errors."""
     pass
 
 
-class AuthenticationError({pkg_name}Error):
+class AuthenticationError({{CLASS_PREFIX}}Error):
     """Authentication failed (401)."""
     pass
 
 
-class PermissionError({pkg_name}Error):
+class PermissionError({{CLASS_PREFIX}}Error):
     """Permission denied (403)."""
     pass
 
 
-class NotFoundError({pkg_name}Error):
+class NotFoundError({{CLASS_PREFIX}}Error):
     """Resource not found (404)."""
     pass
 
 
-class ValidationError({pkg_name}Error):
+class ValidationError({{CLASS_PREFIX}}Error):
     """Invalid request (400)."""
     pass
 
 
-class RateLimitError({pkg_name}Error):
+class RateLimitError({{CLASS_PREFIX}}Error):
     """Rate limit exceeded (429)."""
     pass
 
 
-class ServerError({pkg_name}Error):
+class ServerError({{CLASS_PREFIX}}Error):
     """Server error (5xx)."""
     pass
 
@@ -724,66 +1047,72 @@ def handle_api_error(response):
         pass
 
     if status == 401:
-        raise AuthenticationError(f"Authentication failed: {{message}}")
+        raise AuthenticationError(f"Authentication failed: {message}")
     elif status == 403:
-        raise PermissionError(f"Permission denied: {{message}}")
+        raise PermissionError(f"Permission denied: {message}")
     elif status == 404:
-        raise NotFoundError(f"Not found: {{message}}")
+        raise NotFoundError(f"Not found: {message}")
     elif status == 400:
-        raise ValidationError(f"Invalid request: {{message}}")
+        raise ValidationError(f"Invalid request: {message}")
     elif status == 429:
-        raise RateLimitError(f"Rate limit exceeded: {{message}}")
+        raise RateLimitError(f"Rate limit exceeded: {message}")
     elif status >= 500:
-        raise ServerError(f"Server error: {{message}}")
+        raise ServerError(f"Server error: {message}")
     else:
-        raise {pkg_name}Error(f"Request failed ({{status}}): {{message}}")
+        raise {{CLASS_PREFIX}}Error(f"Request failed ({status}): {message}")
 
 
 def handle_errors(f):
     """
     Decorator for CLI commands to handle exceptions gracefully.
 
-    Catches {api_name} exceptions and displays user-friendly messages.
+    Catches {{API_NAME}} exceptions and displays user-friendly messages.
     """
     @wraps(f)
     def wrapper(*args, **kwargs):
         try:
             return f(*args, **kwargs)
         except AuthenticationError as e:
-            click.echo(click.style(f"Authentication error: {{e}}", fg="red"), err=True)
-            click.echo("Try running: {{ctx.command_path}} auth login", err=True)
+            click.echo(f"{RED}Authentication error: {e}{RESET}", err=True)
+            click.echo("Try running: {ctx.command_path} auth login", err=True)
             raise SystemExit(1)
         except PermissionError as e:
-            click.echo(click.style(f"Permission denied: {{e}}", fg="red"), err=True)
+            click.echo(f"{RED}Permission denied: {e}{RESET}", err=True)
             raise SystemExit(1)
         except NotFoundError as e:
-            click.echo(click.style(f"Not found: {{e}}", fg="red"), err=True)
+            click.echo(f"{RED}Not found: {e}{RESET}", err=True)
             raise SystemExit(1)
         except ValidationError as e:
-            click.echo(click.style(f"Invalid request: {{e}}", fg="red"), err=True)
+            click.echo(f"{RED}Invalid request: {e}{RESET}", err=True)
             raise SystemExit(1)
         except RateLimitError as e:
-            click.echo(click.style(f"Rate limit exceeded: {{e}}", fg="yellow"), err=True)
+            click.echo(f"{YELLOW}Rate limit exceeded: {e}{RESET}", err=True)
             click.echo("Please wait and try again.", err=True)
             raise SystemExit(1)
         except ServerError as e:
-            click.echo(click.style(f"Server error: {{e}}", fg="red"), err=True)
+            click.echo(f"{RED}Server error: {e}{RESET}", err=True)
             click.echo("Please check the service status and try again.", err=True)
             raise SystemExit(1)
-        except {pkg_name}Error as e:
-            click.echo(click.style(f"Error: {{e}}", fg="red"), err=True)
+        except {{CLASS_PREFIX}}Error as e:
+            click.echo(f"{RED}Error: {e}{RESET}", err=True)
             raise SystemExit(1)
     return wrapper
-'''
+''')
 
 
-def generate_validators_py(context: dict) -> str:
-    """Generate validators.py."""
-    return '''"""Input validation utilities."""
+def generate_error_handler_py(context: dict) -> str:
+    """Generate error_handler.py."""
+    return _render(_ERROR_HANDLER_PY_TEMPLATE, _resolve(context))
+
+
+_VALIDATORS_PY_TEMPLATE = _compile('''"""Input validation utilities."""
 
 import re
 from typing import Optional
 
+_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$')
+
 
 def validate_required(value: Optional[str], field_name: str) -> str:
     """
@@ -821,7 +1150,7 @@ def validate_id(value: str, field_name: str = "ID") -> str:
     value = validate_required(value, field_name)
 
     # Allow alphanumeric, hyphens, underscores
-    if not re.match(r'^[a-zA-Z0-9_-]+$', value):
+    if not _ID_RE.match(value):
         raise ValueError(f"Invalid {field_name}: must be alphanumeric with hyphens/underscores")
 
     return value
@@ -867,7 +1196,7 @@ def validate_email(value: str) -> str:
     """
     value = validate_required(value, "email")
 
-    if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$', value):
+    if not _EMAIL_RE.match(value):
         raise ValueError("Invalid email address")
 
     return value
@@ -892,16 +1221,26 @@ def validate_url(value: str) -> str:
         raise ValueError("URL must start with http:// or https://")
 
     return value
-'''
+''')
 
 
-def generate_formatters_py(context: dict) -> str:
-    """Generate formatters.py."""
-    return '''"""Output formatting utilities."""
+def generate_validators_py(context: dict) -> str:
+    """Generate validators.py."""
+    return _render(_VALIDATORS_PY_TEMPLATE, _resolve(context))
+
+
+_FORMATTERS_PY_TEMPLATE = _compile('''"""Output formatting utilities."""
 
 import json
 from typing import Any, Dict, List, Optional
-from tabulate import tabulate
+
+try:
+    import orjson
+except ImportError:  # optional: pip install ".[perf]"
+    orjson = None
+else:
+    # Accept the non-string keys json.dumps accepts
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
 
 class OutputFormatter:
@@ -935,13 +1274,45 @@ class OutputFormatter:
             return format_table(data, headers)
 
 
-def format_table(data: Any, headers: Optional[List[str]] = None) -> str:
+def _render_simple(rows: List[List[Any]], headers: List[str]) -> str:
+    """Render rows as left-aligned columns with a dashed rule under the headers."""
+    lines = [["" if c is None else str(c) for c in row] for row in rows]
+    if headers:
+        lines.insert(0, [str(h) for h in headers])
+
+    columns = max(len(line) for line in lines)
+    for line in lines:
+        line.extend([""] * (columns - len(line)))
+
+    widths = [max(len(c) for c in col) for col in zip(*lines)]
+    row_format = "  ".join(f"{{:<{w}}}" for w in widths)
+    output = [row_format.format(*line).rstrip() for line in lines]
+    if headers:
+        output.insert(1, "  ".join("-" * w for w in widths))
+    return "\\n".join(output)
+
+
+def _render(rows: List[List[Any]], headers: List[str], tablefmt: str) -> str:
+    """Render rows in the given table format."""
+    if tablefmt == "simple":
+        return _render_simple(rows, headers)
+
+    from tabulate import tabulate
+    return tabulate(rows, headers=headers, tablefmt=tablefmt)
+
+
+def format_table(
+    data: Any,
+    headers: Optional[List[str]] = None,
+    tablefmt: str = "simple",
+) -> str:
     """
     Format data as a table.
 
     Args:
         data: Data to format (dict, list of dicts, or list of lists)
         headers: Column headers
+        tablefmt: Table style; anything but "simple" is rendered by tabulate
 
     Returns:
         Formatted table string
@@ -952,18 +1323,18 @@ def format_table(data: Any, headers: Optional[List[str]] = None) -> str:
     # Single dict
     if isinstance(data, dict):
         rows = [[k, v] for k, v in data.items()]
-        return tabulate(rows, headers=["Field", "Value"], tablefmt="simple")
+        return _render(rows, ["Field", "Value"], tablefmt)
 
     # List of dicts
     if isinstance(data, list) and data and isinstance(data[0], dict):
         if not headers:
             headers = list(data[0].keys())
         rows = [[item.get(h, "") for h in headers] for item in data]
-        return tabulate(rows, headers=headers, tablefmt="simple")
+        return _render(rows, headers, tablefmt)
 
     # List of lists/tuples
     if isinstance(data, list):
-        return tabulate(data, headers=headers or [], tablefmt="simple")
+        return _render(data, headers or [], tablefmt)
 
     return str(data)
 
@@ -979,9 +1350,34 @@ def format_json(data: Any, indent: int = 2) -> str:
     Returns:
         JSON string
     """
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(
+                data, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2, default=str
+            ).decode()
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
     return json.dumps(data, indent=indent, default=str)
 
 
+def format_json_line(data: Any) -> str:
+    """
+    Format data as a single line of JSON (one record of NDJSON output).
+
+    Args:
+        data: Data to format
+
+    Returns:
+        Compact JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS, default=str).decode()
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
 def format_text(data: Any) -> str:
     """
     Format data as plain text.
@@ -1005,22 +1401,44 @@ def format_text(data: Any) -> str:
         return "\\n".join(str(item) for item in data)
 
     return str(data)
-'''
+''')
 
 
-def generate_cli_main_py(context: dict) -> str:
-    """Generate cli/main.py."""
-    api_name = context['API_NAME']
-    cli_name = context.get('CLI_NAME', f"{context['TOPIC']}-as")
-    pkg_path = context['TOPIC'].replace('-', '_') + '_assistant_skills_lib'
+def generate_formatters_py(context: dict) -> str:
+    """Generate formatters.py."""
+    return _render(_FORMATTERS_PY_TEMPLATE, _resolve(context))
+
 
-    return f'''"""CLI entry point for {cli_name}."""
+_CLI_MAIN_PY_TEMPLATE = _compile('''"""CLI entry point for {{CLI_NAME}}."""
+
+import importlib
 
 import click
-from .commands import resource_cmds, auth_cmds, config_cmds
 
+# Command groups by name: (module in .commands, attribute). Modules are
+# imported on first use so startup and --help skip the HTTP client stack.
+COMMANDS = {
+    "auth": ("auth_cmds", "auth"),
+    "config": ("config_cmds", "config"),
+    "resource": ("resource_cmds", "resource"),
+}
 
-@click.group()
+
+class LazyGroup(click.Group):
+    """Click group that imports its command modules on demand."""
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *COMMANDS})
+
+    def get_command(self, ctx, name):
+        if name in COMMANDS and name not in self.commands:
+            module_name, attr = COMMANDS[name]
+            module = importlib.import_module(f".commands.{module_name}", __package__)
+            self.add_command(getattr(module, attr), name)
+        return super().get_command(ctx, name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option()
 @click.option("--profile", "-p", default="default", help="Configuration profile")
 @click.option(
@@ -1034,7 +1452,7 @@ from .commands import resource_cmds, auth_cmds, config_cmds
 @click.pass_context
 def cli(ctx, profile: str, output: str, verbose: bool, quiet: bool):
     """
-    {api_name} CLI - Command-line interface for {api_name} automation.
+    {{API_NAME}} CLI - Command-line interface for {{API_NAME}} automation.
 
     Use --profile to switch between configurations (default, development, etc.)
     Use --output to change output format (table, json, text)
@@ -1044,46 +1462,70 @@ def cli(ctx, profile: str, output: str, verbose: bool, quiet: bool):
     ctx.obj["output"] = output
     ctx.obj["verbose"] = verbose
     ctx.obj["quiet"] = quiet
-
-
-# Register command groups
-cli.add_command(resource_cmds.resource)
-cli.add_command(auth_cmds.auth)
-cli.add_command(config_cmds.config)
+    ctx.obj["_clients"] = {}
 
 
 if __name__ == "__main__":
     cli()
-'''
+''')
+
+
+def generate_cli_main_py(context: dict) -> str:
+    """Generate cli/main.py."""
+    return _render(_CLI_MAIN_PY_TEMPLATE, _resolve(context))
+
+
+_CLI_INIT_PY_TEMPLATE = _compile('''"""CLI package."""
+
+
+def get_client(ctx):
+    """
+    Return the API client for the invocation's profile, creating it once.
+
+    Clients are cached on the root context object so subcommands share one
+    session per profile, and closed when the root context is torn down.
+    """
+    from ..client import {{CLASS_PREFIX}}Client
+
+    root = ctx.find_root()
+    clients = root.obj.setdefault("_clients", {})
+    profile = ctx.obj["profile"]
+
+    client = clients.get(profile)
+    if client is None:
+        client = clients[profile] = {{CLASS_PREFIX}}Client(profile=profile)
+        root.call_on_close(client.close)
+    return client
+
+
+# Imported after get_client so command modules can import it from here
+from .main import cli  # noqa: E402
+
+__all__ = ["cli", "get_client"]
+''')
 
 
 def generate_cli_init_py(context: dict) -> str:
     """Generate cli/__init__.py."""
-    return '''"""CLI package."""
+    return _render(_CLI_INIT_PY_TEMPLATE, _resolve(context))
 
-from .main import cli
 
-__all__ = ["cli"]
-'''
+_COMMANDS_INIT_PY_TEMPLATE = _compile('''"""CLI commands package."""
+''')
 
 
 def generate_commands_init_py(context: dict) -> str:
     """Generate cli/commands/__init__.py."""
-    return '''"""CLI commands package."""
-'''
+    return _render(_COMMANDS_INIT_PY_TEMPLATE, _resolve(context))
 
 
-def generate_resource_cmds_py(context: dict) -> str:
-    """Generate cli/commands/resource_cmds.py."""
-    api_name = context['API_NAME']
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
-
-    return f'''"""Resource commands for {api_name} CLI."""
+_RESOURCE_CMDS_PY_TEMPLATE = _compile('''"""Resource commands for {{API_NAME}} CLI."""
 
 import click
-from ...client import {pkg_name}Client
-from ...error_handler import handle_errors
-from ...formatters import OutputFormatter
+from itertools import islice
+from .. import get_client
+from ...error_handler import GREEN, RESET, handle_errors
+from ...formatters import OutputFormatter, format_json_line
 
 
 @click.group()
@@ -1094,25 +1536,36 @@ def resource():
 
 @resource.command("list")
 @click.option("--filter", "-f", "filter_query", help="Filter query")
-@click.option("--limit", "-l", type=int, default=50, help="Maximum results")
+@click.option("--limit", "-l", type=click.IntRange(min=1), default=50, help="Maximum results")
 @click.pass_context
 @handle_errors
 def list_resources(ctx, filter_query, limit):
     """List resources."""
-    client = {pkg_name}Client(profile=ctx.obj["profile"])
+    client = get_client(ctx)
     formatter = OutputFormatter(ctx.obj["output"])
 
-    params = {{"limit": limit}}
+    params = {}
     if filter_query:
         params["filter"] = filter_query
 
-    results = client.get("/resources", params=params)
+    page_size = min(limit, 100)
+    items = islice(
+        client.paginate_iter(
+            "/resources",
+            params=params,
+            page_size=page_size,
+            max_pages=-(-limit // page_size),
+        ),
+        limit,
+    )
 
-    if isinstance(results, dict):
-        items = results.get("items", results.get("data", []))
-    else:
-        items = results
+    # JSON output is streamed as one object per line (NDJSON)
+    if ctx.obj["output"] == "json":
+        for item in items:
+            click.echo(format_json_line(item))
+        return
 
+    items = list(items)
     if not items:
         click.echo("No resources found")
         return
@@ -1126,10 +1579,10 @@ def list_resources(ctx, filter_query, limit):
 @handle_errors
 def get_resource(ctx, resource_id):
     """Get resource details."""
-    client = {pkg_name}Client(profile=ctx.obj["profile"])
+    client = get_client(ctx)
     formatter = OutputFormatter(ctx.obj["output"])
 
-    result = client.get(f"/resources/{{resource_id}}")
+    result = client.get(f"/resources/{resource_id}")
 
     click.echo(formatter.format(result))
 
@@ -1141,17 +1594,17 @@ def get_resource(ctx, resource_id):
 @handle_errors
 def create_resource(ctx, name, description):
     """Create a new resource."""
-    client = {pkg_name}Client(profile=ctx.obj["profile"])
+    client = get_client(ctx)
     formatter = OutputFormatter(ctx.obj["output"])
 
-    data = {{"name": name}}
+    data = {"name": name}
     if description:
         data["description"] = description
 
     result = client.post("/resources", data=data)
 
     if not ctx.obj["quiet"]:
-        click.echo(click.style("Resource created successfully!", fg="green"))
+        click.echo(f"{GREEN}Resource created successfully!{RESET}")
 
     click.echo(formatter.format(result))
 
@@ -1164,10 +1617,10 @@ def create_resource(ctx, name, description):
 @handle_errors
 def update_resource(ctx, resource_id, name, description):
     """Update an existing resource."""
-    client = {pkg_name}Client(profile=ctx.obj["profile"])
+    client = get_client(ctx)
     formatter = OutputFormatter(ctx.obj["output"])
 
-    data = {{}}
+    data = {}
     if name:
         data["name"] = name
     if description:
@@ -1177,10 +1630,10 @@ def update_resource(ctx, resource_id, name, description):
         click.echo("No updates specified", err=True)
         raise SystemExit(1)
 
-    result = client.patch(f"/resources/{{resource_id}}", data=data)
+    result = client.patch(f"/resources/{resource_id}", data=data)
 
     if not ctx.obj["quiet"]:
-        click.echo(click.style("Resource updated successfully!", fg="green"))
+        click.echo(f"{GREEN}Resource updated successfully!{RESET}")
 
     click.echo(formatter.format(result))
 
@@ -1193,29 +1646,29 @@ def update_resource(ctx, resource_id, name, description):
 def delete_resource(ctx, resource_id, force):
     """Delete a resource."""
     if not force:
-        if not click.confirm(f"Delete resource {{resource_id}}?"):
+        if not click.confirm(f"Delete resource {resource_id}?"):
             click.echo("Cancelled")
             return
 
-    client = {pkg_name}Client(profile=ctx.obj["profile"])
-    client.delete(f"/resources/{{resource_id}}")
+    client = get_client(ctx)
+    client.delete(f"/resources/{resource_id}")
 
     if not ctx.obj["quiet"]:
-        click.echo(click.style("Resource deleted successfully!", fg="green"))
-'''
+        click.echo(f"{GREEN}Resource deleted successfully!{RESET}")
+''')
 
 
-def generate_auth_cmds_py(context: dict) -> str:
-    """Generate cli/commands/auth_cmds.py."""
-    api_name = context['API_NAME']
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
+def generate_resource_cmds_py(context: dict) -> str:
+    """Generate cli/commands/resource_cmds.py."""
+    return _render(_RESOURCE_CMDS_PY_TEMPLATE, _resolve(context))
 
-    return f'''"""Authentication commands for {api_name} CLI."""
+
+_AUTH_CMDS_PY_TEMPLATE = _compile('''"""Authentication commands for {{API_NAME}} CLI."""
 
 import click
+from .. import get_client
 from ...config_manager import ConfigManager
-from ...client import {pkg_name}Client
-from ...error_handler import handle_errors
+from ...error_handler import GREEN, RED, RESET, YELLOW, handle_errors
 
 
 @click.group()
@@ -1235,19 +1688,19 @@ def auth_status(ctx):
     base_url = config.get("base_url", profile=profile)
     api_key = config.get("api_key", profile=profile)
 
-    click.echo(f"Profile: {{profile}}")
-    click.echo(f"Base URL: {{base_url or '(not set)'}}")
-    click.echo(f"API Key: {{'(set)' if api_key else '(not set)'}}")
+    click.echo(f"Profile: {profile}")
+    click.echo(f"Base URL: {base_url or '(not set)'}")
+    click.echo(f"API Key: {'(set)' if api_key else '(not set)'}")
 
     if base_url and api_key:
         try:
-            client = {pkg_name}Client(profile=profile)
+            get_client(ctx)
             # Try a simple request to verify
-            click.echo(click.style("\\n✓ Authentication valid", fg="green"))
+            click.echo(f"{GREEN}\\n✓ Authentication valid{RESET}")
         except Exception as e:
-            click.echo(click.style(f"\\n✗ Authentication failed: {{e}}", fg="red"))
+            click.echo(f"{RED}\\n✗ Authentication failed: {e}{RESET}")
     else:
-        click.echo(click.style("\\n✗ Configuration incomplete", fg="yellow"))
+        click.echo(f"{YELLOW}\\n✗ Configuration incomplete{RESET}")
 
 
 @auth.command("login")
@@ -1262,7 +1715,7 @@ def auth_login(ctx, api_key, base_url):
     config.set("api_key", api_key, profile=profile)
     config.set("base_url", base_url, profile=profile)
 
-    click.echo(click.style(f"Authentication configured for profile '{{profile}}'", fg="green"))
+    click.echo(f"{GREEN}Authentication configured for profile '{profile}'{RESET}")
 
 
 @auth.command("logout")
@@ -1273,23 +1726,27 @@ def auth_logout(ctx, force):
     profile = ctx.obj["profile"]
 
     if not force:
-        if not click.confirm(f"Remove authentication for profile '{{profile}}'?"):
+        if not click.confirm(f"Remove authentication for profile '{profile}'?"):
             click.echo("Cancelled")
             return
 
     config = ConfigManager()
     config.delete("api_key", profile=profile)
 
-    click.echo(click.style(f"Authentication removed for profile '{{profile}}'", fg="green"))
-'''
+    click.echo(f"{GREEN}Authentication removed for profile '{profile}'{RESET}")
+''')
 
 
-def generate_config_cmds_py(context: dict) -> str:
-    """Generate cli/commands/config_cmds.py."""
-    return '''"""Configuration commands."""
+def generate_auth_cmds_py(context: dict) -> str:
+    """Generate cli/commands/auth_cmds.py."""
+    return _render(_AUTH_CMDS_PY_TEMPLATE, _resolve(context))
+
+
+_CONFIG_CMDS_PY_TEMPLATE = _compile('''"""Configuration commands."""
 
 import click
 from ...config_manager import ConfigManager
+from ...error_handler import GREEN, RESET
 
 
 @click.group()
@@ -1324,7 +1781,7 @@ def config_set(ctx, key, value):
     profile = ctx.obj["profile"]
 
     config_mgr.set(key, value, profile=profile)
-    click.echo(click.style(f"Set {key} for profile '{profile}'", fg="green"))
+    click.echo(f"{GREEN}Set {key} for profile '{profile}'{RESET}")
 
 
 @config.command("delete")
@@ -1336,7 +1793,7 @@ def config_delete(ctx, key):
     profile = ctx.obj["profile"]
 
     if config_mgr.delete(key, profile=profile):
-        click.echo(click.style(f"Deleted {key} from profile '{profile}'", fg="green"))
+        click.echo(f"{GREEN}Deleted {key} from profile '{profile}'{RESET}")
     else:
         click.echo(f"{key} not found in profile '{profile}'")
 
@@ -1375,14 +1832,15 @@ def config_profiles():
     click.echo("Available profiles:")
     for profile in profiles:
         click.echo(f"  - {profile}")
-'''
+''')
 
 
-def generate_test_conftest_py(context: dict) -> str:
-    """Generate tests/conftest.py."""
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
+def generate_config_cmds_py(context: dict) -> str:
+    """Generate cli/commands/config_cmds.py."""
+    return _render(_CONFIG_CMDS_PY_TEMPLATE, _resolve(context))
+
 
-    return f'''"""Test fixtures for {context['LIB_NAME']}."""
+_TEST_CONFTEST_PY_TEMPLATE = _compile('''"""Test fixtures for {{LIB_NAME}}."""
 
 import pytest
 from unittest.mock import MagicMock, patch
@@ -1401,12 +1859,12 @@ def temp_dir():
 
 @pytest.fixture
 def mock_client():
-    """Create a mock {pkg_name}Client."""
+    """Create a mock {{CLASS_PREFIX}}Client."""
     client = MagicMock()
-    client.get.return_value = {{"items": [], "total": 0}}
-    client.post.return_value = {{"id": "123", "status": "created"}}
-    client.put.return_value = {{"id": "123", "status": "updated"}}
-    client.patch.return_value = {{"id": "123", "status": "updated"}}
+    client.get.return_value = {"items": [], "total": 0}
+    client.post.return_value = {"id": "123", "status": "created"}
+    client.put.return_value = {"id": "123", "status": "updated"}
+    client.patch.return_value = {"id": "123", "status": "updated"}
     client.delete.return_value = None
     return client
 
@@ -1414,12 +1872,12 @@ def mock_client():
 @pytest.fixture
 def sample_resource():
     """Sample resource data."""
-    return {{
+    return {
         "id": "resource-123",
         "name": "Test Resource",
         "description": "A test resource",
         "status": "active",
-    }}
+    }
 
 
 @pytest.fixture
@@ -1431,28 +1889,28 @@ def sample_resources(sample_resource):
 @pytest.fixture
 def mock_config(temp_dir):
     """Create a mock config manager."""
-    with patch('{{context['TOPIC'].replace('-', '_')}}_assistant_skills_lib.config_manager.ConfigManager') as mock:
+    with patch('{{PKG_PATH}}.config_manager.ConfigManager') as mock:
         instance = MagicMock()
         instance.get.return_value = "test-value"
         mock.return_value = instance
         yield instance
-'''
+''')
 
 
-def generate_test_client_py(context: dict) -> str:
-    """Generate tests/test_client.py."""
-    pkg_name = context['TOPIC'].replace('-', '_').title().replace('_', '')
-    pkg_path = context['TOPIC'].replace('-', '_') + '_assistant_skills_lib'
+def generate_test_conftest_py(context: dict) -> str:
+    """Generate tests/conftest.py."""
+    return _render(_TEST_CONFTEST_PY_TEMPLATE, _resolve(context))
 
-    return f'''"""Tests for {pkg_name}Client."""
+
+_TEST_CLIENT_PY_TEMPLATE = _compile('''"""Tests for {{CLASS_PREFIX}}Client."""
 
 import pytest
 from unittest.mock import patch, MagicMock
-from {pkg_path}.client import {pkg_name}Client
-from {pkg_path}.error_handler import AuthenticationError, NotFoundError
+from {{PKG_PATH}}.client import {{CLASS_PREFIX}}Client
+from {{PKG_PATH}}.error_handler import AuthenticationError, NotFoundError
 
 
-class Test{pkg_name}Client:
+class Test{{CLASS_PREFIX}}Client:
     """Tests for the HTTP client."""
 
     def test_client_requires_base_url(self, mock_config):
@@ -1460,7 +1918,7 @@ class Test{pkg_name}Client:
         mock_config.get.return_value = None
 
         with pytest.raises(AuthenticationError):
-            {pkg_name}Client()
+            {{CLASS_PREFIX}}Client()
 
     def test_client_requires_api_key(self, mock_config):
         """Test that client raises error without api_key."""
@@ -1472,7 +1930,7 @@ class Test{pkg_name}Client:
         mock_config.get.side_effect = get_side_effect
 
         with pytest.raises(AuthenticationError):
-            {pkg_name}Client()
+            {{CLASS_PREFIX}}Client()
 
     @patch('requests.Session')
     def test_client_get_request(self, mock_session, mock_config):
@@ -1481,18 +1939,18 @@ class Test{pkg_name}Client:
 
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.content = b'{{"data": "test"}}'
-        mock_response.json.return_value = {{"data": "test"}}
+        mock_response.content = b'{"data": "test"}'
+        mock_response.json.return_value = {"data": "test"}
 
         mock_session.return_value.request.return_value = mock_response
 
-        client = {pkg_name}Client(
+        client = {{CLASS_PREFIX}}Client(
             base_url="https://api.example.com",
             api_key="test-key"
         )
         result = client.get("/test")
 
-        assert result == {{"data": "test"}}
+        assert result == {"data": "test"}
 
     @patch('requests.Session')
     def test_client_handles_404(self, mock_session, mock_config):
@@ -1503,18 +1961,119 @@ class Test{pkg_name}Client:
         mock_response.ok = False
         mock_response.status_code = 404
         mock_response.text = "Not found"
-        mock_response.json.return_value = {{"message": "Resource not found"}}
+        mock_response.json.return_value = {"message": "Resource not found"}
 
         mock_session.return_value.request.return_value = mock_response
 
-        client = {pkg_name}Client(
+        client = {{CLASS_PREFIX}}Client(
             base_url="https://api.example.com",
             api_key="test-key"
         )
 
         with pytest.raises(NotFoundError):
             client.get("/not-found")
-'''
+''')
+
+
+def generate_test_client_py(context: dict) -> str:
+    """Generate tests/test_client.py."""
+    return _render(_TEST_CLIENT_PY_TEMPLATE, _resolve(context))
+
+
+def _write_file(path: str, data: bytes):
+    """Write data with raw os.open/os.write: one open, one write, one close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _emit(output_path: str, dirs: list, files: list, context: dict, parallel: bool = True):
+    """
+    Create dirs and every file parent in one pass, then render and write each file.
+
+    files holds (path, generator) pairs. Each generator is called with context
+    just before its file is written (None writes an empty file), so no list
+    of rendered contents is built. With parallel=False files are written one
+    at a time, in order.
+    """
+    prefix = output_path + os.sep
+
+    needed = {prefix + d if d else output_path for d in dirs}
+    needed.update(os.path.dirname(prefix + file_path) for file_path, _ in files)
+    # Shortest first, so each makedirs finds its parent already in place
+    for directory in sorted(needed, key=len):
+        os.makedirs(directory, exist_ok=True)
+
+    def write(item):
+        file_path, generate = item
+        _write_file(prefix + file_path, generate(context).encode('utf-8') if generate else b'')
+
+    if not parallel:
+        for item in files:
+            write(item)
+        return
+
+    # Writes are independent; overlap their syscall latency. Imported here so
+    # dry runs and template-only callers never load concurrent.futures.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(files) or 1)) as executor:
+        list(executor.map(write, files))
+
+
+# Package layout; {src} is the package directory, src/<PKG_PATH>
+_DIRS = (
+    '',
+    'src',
+    '{src}',
+    '{src}/cli',
+    '{src}/cli/commands',
+    'tests',
+)
+
+# Files and their generators (None for an empty file)
+_FILES = (
+    # Root files
+    ('pyproject.toml', generate_pyproject_toml),
+    ('README.md', generate_readme),
+
+    # Package files
+    ('{src}/__init__.py', generate_init_py),
+    ('{src}/client.py', generate_client_py),
+    ('{src}/config_manager.py', generate_config_manager_py),
+    ('{src}/error_handler.py', generate_error_handler_py),
+    ('{src}/validators.py', generate_validators_py),
+    ('{src}/formatters.py', generate_formatters_py),
+
+    # CLI files
+    ('{src}/cli/__init__.py', generate_cli_init_py),
+    ('{src}/cli/main.py', generate_cli_main_py),
+    ('{src}/cli/commands/__init__.py', generate_commands_init_py),
+    ('{src}/cli/commands/resource_cmds.py', generate_resource_cmds_py),
+    ('{src}/cli/commands/auth_cmds.py', generate_auth_cmds_py),
+    ('{src}/cli/commands/config_cmds.py', generate_config_cmds_py),
+
+    # Test files
+    ('tests/__init__.py', None),
+    ('tests/conftest.py', generate_test_conftest_py),
+    ('tests/test_client.py', generate_test_client_py),
+)
+
+
+@lru_cache(maxsize=None)
+def _base_context(lib_name: str, topic: str, api_name: str, api_url: str, auth_method: str) -> dict:
+    """Build the enriched context for a set of names; callers copy before adding to it."""
+    return _enrich({
+        'LIB_NAME': lib_name,
+        'TOPIC': topic,
+        'API_NAME': api_name,
+        'API_URL': api_url,
+        'AUTH_METHOD': auth_method,
+    })
 
 
 def scaffold_library(
@@ -1525,7 +2084,8 @@ def scaffold_library(
     auth_method: str = 'api_key',
     resources: list = None,
     output_dir: str = '.',
-    dry_run: bool = False
+    dry_run: bool = False,
+    parallel: bool = True
 ) -> dict:
     """
     Create a CLI library package.
@@ -1533,100 +2093,79 @@ def scaffold_library(
     Returns dict with created files and directories.
     """
     # Prepare context
-    cli_name = f'{topic}-as'
-    pkg_name = topic.replace('-', '_') + '_assistant_skills_lib'
-
-    context = {
-        'LIB_NAME': lib_name,
-        'TOPIC': topic,
-        'API_NAME': api_name,
-        'API_URL': api_url or 'https://api.example.com',
-        'AUTH_METHOD': auth_method,
-        'CLI_NAME': cli_name,
-        'PKG_NAME': pkg_name,
-        'RESOURCES': resources or ['resource'],
-        'DATE': datetime.now().isoformat()
-    }
+    context = dict(_base_context(
+        lib_name, topic, api_name, api_url or 'https://api.example.com', auth_method
+    ))
+    context['RESOURCES'] = resources or ['resource']
+    pkg_path = context['PKG_PATH']
 
     # Determine output path
-    output_path = Path(output_dir).expanduser().resolve() / lib_name
+    output_path = str(Path(output_dir).expanduser().resolve() / lib_name)
 
-    if output_path.exists() and not dry_run:
-        raise ValueError(f"Directory already exists: {output_path}")
+    if not dry_run:
+        try:
+            os.stat(output_path)
+        except FileNotFoundError:
+            pass
+        else:
+            raise ValueError(f"Directory already exists: {output_path}")
 
     result = {
-        'path': str(output_path),
+        'path': output_path,
         'directories': [],
         'files': []
     }
 
-    # Create directories
-    src_path = f'src/{pkg_name}'
-    dirs = [
-        '',
-        'src',
-        src_path,
-        f'{src_path}/cli',
-        f'{src_path}/cli/commands',
-        'tests',
-    ]
-
-    for d in dirs:
-        full_path = output_path / d if d else output_path
-        result['directories'].append(d or '.')
-        if not dry_run:
-            full_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate files
-    files_to_create = [
-        # Root files
-        ('pyproject.toml', generate_pyproject_toml(context)),
-        ('README.md', generate_readme(context)),
-
-        # Package files
-        (f'{src_path}/__init__.py', generate_init_py(context)),
-        (f'{src_path}/client.py', generate_client_py(context)),
-        (f'{src_path}/config_manager.py', generate_config_manager_py(context)),
-        (f'{src_path}/error_handler.py', generate_error_handler_py(context)),
-        (f'{src_path}/validators.py', generate_validators_py(context)),
-        (f'{src_path}/formatters.py', generate_formatters_py(context)),
-
-        # CLI files
-        (f'{src_path}/cli/__init__.py', generate_cli_init_py(context)),
-        (f'{src_path}/cli/main.py', generate_cli_main_py(context)),
-        (f'{src_path}/cli/commands/__init__.py', generate_commands_init_py(context)),
-        (f'{src_path}/cli/commands/resource_cmds.py', generate_resource_cmds_py(context)),
-        (f'{src_path}/cli/commands/auth_cmds.py', generate_auth_cmds_py(context)),
-        (f'{src_path}/cli/commands/config_cmds.py', generate_config_cmds_py(context)),
-
-        # Test files
-        ('tests/__init__.py', ''),
-        ('tests/conftest.py', generate_test_conftest_py(context)),
-        ('tests/test_client.py', generate_test_client_py(context)),
-    ]
-
-    for file_path, content in files_to_create:
-        full_path = output_path / file_path
-        result['files'].append(file_path)
-        if not dry_run:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content)
+    # Resolve the {src} placeholder in the layout tables
+    src_path = f'src/{pkg_path}'
+    dirs = [d.format(src=src_path) for d in _DIRS]
+    files = [(file_path.format(src=src_path), generate) for file_path, generate in _FILES]
+
+    result['directories'] = [d or '.' for d in dirs]
+    result['files'] = [file_path for file_path, _ in files]
+    if dry_run:
+        # Nothing is written, so no content is generated
+        return result
+
+    _emit(output_path, dirs, files, context, parallel=parallel)
 
     return result
 
 
+# Wizard output blocks, each written with a single write
+_RULE = "=" * 60
+_THIN_RULE = "-" * 60
+_WIZARD_BANNER = f"\n{_RULE}\n  CLI Library Scaffold Wizard\n{_RULE}\n\n"
+_AUTH_METHODS_LINE = f"\nAuthentication methods: {', '.join(AUTH_METHODS)}\n"
+_AUTH_PROMPT = f"Auth method [{AUTH_METHODS[0]}]: "
+_SUMMARY_TEMPLATE = (
+    f"\n{_THIN_RULE}\nSummary:\n{_THIN_RULE}\n"
+    "  Library:     {lib_name}\n"
+    "  Topic:       {topic}\n"
+    "  API Name:    {api_name}\n"
+    "  API URL:     {api_url}\n"
+    "  Auth:        {auth_method}\n"
+    "  CLI Name:    {topic}-as\n"
+    f"{_THIN_RULE}\n"
+)
+
+
+def _write(text: str):
+    """Write a block of text to stdout and flush it."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def interactive_mode():
     """Run interactive wizard."""
-    print("\n" + "=" * 60)
-    print("  CLI Library Scaffold Wizard")
-    print("=" * 60 + "\n")
+    _write(_WIZARD_BANNER)
 
     # Library name
     lib_name = input("Library name (e.g., myapi-assistant-skills-lib): ").strip()
     lib_name = validate_required(lib_name, "library name")
 
     # Extract topic from library name
-    default_topic = lib_name.replace('-assistant-skills-lib', '').replace('-lib', '')
+    default_topic = _default_topic(lib_name)
     topic = input(f"Topic prefix [{default_topic}]: ").strip()
     if not topic:
         topic = default_topic
@@ -1645,23 +2184,19 @@ def interactive_mode():
         api_url = validate_url(api_url)
 
     # Auth method
-    print(f"\nAuthentication methods: {', '.join(AUTH_METHODS)}")
-    auth_method = input(f"Auth method [{AUTH_METHODS[0]}]: ").strip().lower()
+    _write(_AUTH_METHODS_LINE)
+    auth_method = input(_AUTH_PROMPT).strip().lower()
     if not auth_method:
         auth_method = AUTH_METHODS[0]
-    auth_method = validate_choice(auth_method, AUTH_METHODS, "auth method")
+    if auth_method not in _AUTH_METHODS_SET:
+        # Raises with the list of valid choices
+        auth_method = validate_choice(auth_method, AUTH_METHODS, "auth method")
 
     # Confirmation
-    print("\n" + "-" * 60)
-    print("Summary:")
-    print("-" * 60)
-    print(f"  Library:     {lib_name}")
-    print(f"  Topic:       {topic}")
-    print(f"  API Name:    {api_name}")
-    print(f"  API URL:     {api_url}")
-    print(f"  Auth:        {auth_method}")
-    print(f"  CLI Name:    {topic}-as")
-    print("-" * 60)
+    _write(_SUMMARY_TEMPLATE.format(
+        lib_name=lib_name, topic=topic, api_name=api_name,
+        api_url=api_url, auth_method=auth_method,
+    ))
 
     confirm = input("\nProceed? [Y/n]: ").strip().lower()
     if confirm and confirm != 'y':
@@ -1677,7 +2212,9 @@ def interactive_mode():
     }
 
 
-def main():
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once per process."""
     parser = argparse.ArgumentParser(
         description='Scaffold a CLI library package',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1707,8 +2244,13 @@ Examples:
     parser.add_argument('--output-dir', '-o', default='.', help='Output directory')
     parser.add_argument('--dry-run', '-d', action='store_true',
                         help='Preview without creating files')
+    parser.add_argument('--no-parallel', dest='parallel', action='store_false',
+                        help='Write files one at a time, in order')
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     try:
         if not args.name:
@@ -1716,7 +2258,7 @@ Examples:
             if not config:
                 sys.exit(0)
         else:
-            topic = args.topic or args.name.replace('-assistant-skills-lib', '').replace('-lib', '')
+            topic = args.topic or _default_topic(args.name)
             config = {
                 'lib_name': args.name,
                 'topic': validate_topic_prefix(topic),
@@ -1735,27 +2277,32 @@ Examples:
             api_url=config.get('api_url'),
             auth_method=config.get('auth_method', 'api_key'),
             output_dir=args.output_dir,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            parallel=args.parallel
         )
 
         print_success(f"Created library at: {result['path']}")
-        print(f"\nDirectories: {len(result['directories'])}")
-        print(f"Files: {len(result['files'])}")
 
+        lines = [
+            f"\nDirectories: {len(result['directories'])}",
+            f"Files: {len(result['files'])}",
+        ]
         if args.dry_run:
-            print("\nFiles that would be created:")
-            for f in result['files']:
-                print(f"  {f}")
+            lines.append("\nFiles that would be created:")
+            lines.extend(f"  {f}" for f in result['files'])
 
         # Next steps
-        print("\n" + "=" * 60)
-        print("Next Steps:")
-        print("=" * 60)
-        print(f"1. cd {result['path']}")
-        print("2. pip install -e .")
-        print(f"3. {config['topic']}-as --help")
-        print("4. Customize resource commands for your API")
-        print("5. Run tests: pytest tests/ -v")
+        lines += [
+            f"\n{_RULE}",
+            "Next Steps:",
+            _RULE,
+            f"1. cd {result['path']}",
+            "2. pip install -e .",
+            f"3. {config['topic']}-as --help",
+            "4. Customize resource commands for your API",
+            "5. Run tests: pytest tests/ -v",
+        ]
+        _write("\n".join(lines) + "\n")
 
     except ValidationError as e:
         print_error(str(e))
@@ -42,9 +42,11 @@ Examples:
 import argparse
 import json
 import os
+import re
 import sys
-from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
+from string import Formatter
 
 from assistant_skills_lib import (
     load_template, render_template, get_template_dir,
@@ -56,13 +58,25 @@ from assistant_skills_lib import (
 
 
 # Project types
-PROJECT_TYPES = ['cli-wrapper', 'custom-library', 'hybrid']
+PROJECT_TYPES = ('cli-wrapper', 'custom-library', 'hybrid')
+_PROJECT_TYPES_SET = frozenset(PROJECT_TYPES)
 
 # Authentication methods
-AUTH_METHODS = ['api_key', 'oauth', 'jwt', 'basic']
+AUTH_METHODS = ('api_key', 'oauth', 'jwt', 'basic')
+_AUTH_METHODS_SET = frozenset(AUTH_METHODS)
 
 # Pagination styles
-PAGINATION_STYLES = ['offset', 'cursor', 'page', 'link']
+PAGINATION_STYLES = ('offset', 'cursor', 'page', 'link')
+_PAGINATION_STYLES_SET = frozenset(PAGINATION_STYLES)
+
+# Project types that ship a custom CLI library
+_LIBRARY_PROJECT_TYPES = frozenset({'custom-library', 'hybrid'})
+
+# os.writev is POSIX-only; elsewhere multi-part files are joined and written once
+_HAS_WRITEV = hasattr(os, 'writev')
+
+# Spaces and dashes in an API name become underscores in env var names
+_ENV_SEPARATORS = str.maketrans(' -', '__')
 
 
 def create_directory_structure(
@@ -73,8 +87,6 @@ def create_directory_structure(
     dry_run: bool = False
 ) -> list:
     """Create the project directory structure."""
-    created = []
-
     # Core directories (new structure)
     dirs = [
         '.claude-plugin',
@@ -101,29 +113,122 @@ def create_directory_structure(
         ])
 
     # Add library directory for custom-library and hybrid projects
-    if project_type in ('custom-library', 'hybrid'):
+    if project_type in _LIBRARY_PROJECT_TYPES:
         lib_name = f'{topic}-assistant-skills-lib'
+        pkg_dir = f'{lib_name}/src/{topic.replace("-", "_")}_assistant_skills_lib'
         dirs.extend([
             lib_name,
             f'{lib_name}/src',
-            f'{lib_name}/src/{topic.replace("-", "_")}_assistant_skills_lib',
-            f'{lib_name}/src/{topic.replace("-", "_")}_assistant_skills_lib/cli',
-            f'{lib_name}/src/{topic.replace("-", "_")}_assistant_skills_lib/cli/commands',
+            pkg_dir,
+            f'{pkg_dir}/cli',
+            f'{pkg_dir}/cli/commands',
             f'{lib_name}/tests',
         ])
 
-    for dir_path in dirs:
-        full_path = base_path / dir_path
-        if not dry_run:
-            full_path.mkdir(parents=True, exist_ok=True)
-        created.append(dir_path)
+    if not dry_run:
+        # os.makedirs creates missing ancestors, so only leaf directories need a call
+        parents = {dir_path.rpartition('/')[0] for dir_path in dirs}
+        base = str(base_path)
+        for dir_path in dirs:
+            if dir_path not in parents:
+                os.makedirs(os.path.join(base, dir_path), exist_ok=True)
 
-    return created
+    return dirs
 
 
-def generate_gitignore(context: dict) -> str:
-    """Generate .gitignore content."""
-    return """# Python
+def _resolve(context: dict) -> dict:
+    """
+    Return context with the derived values the templates use filled in.
+
+    CLI_COMMAND is the command the generated docs invoke: the wrapped CLI tool
+    for cli-wrapper projects, otherwise the project's own {topic}-as CLI.
+    scaffold_project resolves these once when it builds the context, so its
+    context is returned as is.
+    """
+    if 'CLI_COMMAND' in context:
+        return context
+
+    topic = context['TOPIC']
+    cli_tool = context.get('CLI_TOOL', topic)
+    if context.get('PROJECT_TYPE', 'cli-wrapper') == 'cli-wrapper':
+        cli_command = cli_tool
+    else:
+        cli_command = f'{topic}-as'
+
+    return dict(
+        context,
+        CLI_COMMAND=cli_command,
+        CLI_INSTALL=context.get('CLI_INSTALL', f'brew install {cli_tool}'),
+        API_ENV_PREFIX=context.get('API_ENV_PREFIX') or context['API_NAME'].upper().translate(_ENV_SEPARATORS),
+        API_URL=context.get('API_URL', 'https://api.example.com'),
+    )
+
+
+# Generated file bodies are module-level templates written with the
+# {{PLACEHOLDER}} syntax of assistant_skills_lib.render_template, so emitted
+# text needs no brace escaping. _compile converts each one to str.format_map
+# form once at import, and _render memoizes the result per set of values.
+_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+
+
+def _compile(template: str) -> str:
+    """Convert a {{PLACEHOLDER}} template to a str.format_map template."""
+    parts = _PLACEHOLDER.split(template)
+    parts[::2] = [text.replace('{', '{{').replace('}', '}}') for text in parts[::2]]
+    parts[1::2] = ['{' + name + '}' for name in parts[1::2]]
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def _fields(template: str) -> tuple:
+    """Return the placeholder names used by a compiled template."""
+    return tuple(sorted({name for _, name, _, _ in Formatter().parse(template) if name}))
+
+
+@lru_cache(maxsize=256)
+def _format(template: str, values: tuple) -> str:
+    """Fill a compiled template from (name, value) pairs."""
+    return template.format_map(dict(values))
+
+
+def _render(template: str, context: dict) -> str:
+    """Render a compiled template, memoized on the context values it uses."""
+    return _format(template, tuple((name, context[name]) for name in _fields(template)))
+
+
+def _split(template: str, *names: str) -> tuple:
+    """Split a compiled template at the given placeholders, in order."""
+    parts = []
+    for name in names:
+        head, template = template.split('{' + name + '}')
+        parts.append(head)
+    parts.append(template)
+    return tuple(parts)
+
+
+# Rows are small and a project renders four per skill, so this holds more
+# entries than _format
+@lru_cache(maxsize=1024)
+def _skill_row(template: str, topic: str, skill: str) -> str:
+    """Render a per-skill row template, memoized on topic and skill."""
+    return template.format_map({'TOPIC': topic, 'SKILL': skill, 'SKILL_TITLE': skill.title()})
+
+
+def clear_template_caches():
+    """
+    Drop every memoized render.
+
+    Generators cache their output per set of context values; long-running
+    callers that scaffold many distinct projects can call this to release
+    that memory.
+    """
+    for cached in (_fields, _format, _skill_row):
+        cached.cache_clear()
+
+
+# Files whose content does not depend on the context; the writer takes
+# their pre-encoded bytes directly.
+_GITIGNORE = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -185,69 +290,72 @@ logs/
 # Cache
 .cache/
 """
+_GITIGNORE_BYTES = _GITIGNORE.encode('utf-8')
+
+_VERSION = "1.0.0"
+_VERSION_BYTES = _VERSION.encode('utf-8')
+
+
+def generate_gitignore(context: dict) -> str:
+    """Generate .gitignore content."""
+    return _GITIGNORE
 
 
 def generate_version_file(context: dict) -> str:
     """Generate VERSION file."""
-    return "1.0.0"
+    return _VERSION
+
+
+# The manifests have a fixed shape, so they are laid out by hand in
+# json.dumps(indent=2) form; json.dumps only escapes the string values.
+_PLUGIN_JSON_TEMPLATE = _compile("""{
+  "name": {{NAME_JSON}},
+  "version": "1.0.0",
+  "description": {{DESCRIPTION_JSON}},
+  "skills": [
+    {{SKILLS_JSON}}
+  ],
+  "commands": [
+    "./commands/*.md"
+  ]
+}""")
+
+_MARKETPLACE_JSON_TEMPLATE = _compile("""{
+  "name": {{NAME_JSON}},
+  "version": "1.0.0",
+  "plugins": [
+    {
+      "name": {{NAME_JSON}},
+      "source": "./",
+      "description": {{DESCRIPTION_JSON}}
+    }
+  ]
+}""")
 
 
 def generate_plugin_json(context: dict) -> str:
     """Generate .claude-plugin/plugin.json content."""
     topic = context['TOPIC']
-    project_name = context['PROJECT_NAME']
-
-    plugin = {
-        "name": project_name.lower(),
-        "version": "1.0.0",
-        "description": f"Claude Code skills for {context['API_NAME']} automation",
-        "skills": [
-            f"../skills/{topic}-assistant/SKILL.md"
-        ],
-        "commands": [
-            "./commands/*.md"
-        ]
-    }
-
-    # Add skills
-    for skill in context.get('SKILLS', []):
-        plugin['skills'].append(f"../skills/{topic}-{skill}/SKILL.md")
+    skill_paths = [f"../skills/{topic}-assistant/SKILL.md"]
+    skill_paths.extend(f"../skills/{topic}-{skill}/SKILL.md" for skill in context.get('SKILLS', []))
 
-    return json.dumps(plugin, indent=2)
+    return _render(_PLUGIN_JSON_TEMPLATE, {
+        'NAME_JSON': json.dumps(context['PROJECT_NAME'].lower()),
+        'DESCRIPTION_JSON': json.dumps(f"Claude Code skills for {context['API_NAME']} automation"),
+        'SKILLS_JSON': ',\n    '.join(map(json.dumps, skill_paths)),
+    })
 
 
 def generate_marketplace_json(context: dict) -> str:
     """Generate .claude-plugin/marketplace.json content."""
-    project_name = context['PROJECT_NAME']
-    topic = context['TOPIC']
-
-    marketplace = {
-        "name": project_name.lower(),
-        "version": "1.0.0",
-        "plugins": [
-            {
-                "name": project_name.lower(),
-                "source": "./",
-                "description": f"{context['API_NAME']} automation skills for Claude Code"
-            }
-        ]
-    }
-
-    return json.dumps(marketplace, indent=2)
+    return _render(_MARKETPLACE_JSON_TEMPLATE, {
+        'NAME_JSON': json.dumps(context['PROJECT_NAME'].lower()),
+        'DESCRIPTION_JSON': json.dumps(f"{context['API_NAME']} automation skills for Claude Code"),
+    })
 
 
-def generate_setup_command(context: dict) -> str:
-    """Generate setup command markdown."""
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
-
-    if project_type == 'cli-wrapper':
-        cli_tool = context.get('CLI_TOOL', topic)
-        cli_install = context.get('CLI_INSTALL', f'brew install {cli_tool}')
-
-        return f"""---
-description: "Set up {api_name} Assistant Skills with credentials and configuration"
+_CLI_SETUP_COMMAND_TEMPLATE = _compile("""---
+description: "Set up {{API_NAME}} Assistant Skills with credentials and configuration"
 user_invocable: true
 arguments:
   - name: profile
@@ -256,24 +364,24 @@ arguments:
     default: "default"
 ---
 
-# {api_name} Assistant Setup
+# {{API_NAME}} Assistant Setup
 
-Set up {api_name} Assistant Skills for Claude Code.
+Set up {{API_NAME}} Assistant Skills for Claude Code.
 
 ## Prerequisites
 
-Install the {cli_tool} CLI:
+Install the {{CLI_COMMAND}} CLI:
 
 ```bash
-{cli_install}
+{{CLI_INSTALL}}
 ```
 
 ## Authentication
 
-Authenticate with {api_name}:
+Authenticate with {{API_NAME}}:
 
 ```bash
-{cli_tool} auth login
+{{CLI_COMMAND}} auth login
 ```
 
 ## Verification
@@ -281,26 +389,24 @@ Authenticate with {api_name}:
 Verify your setup:
 
 ```bash
-{cli_tool} auth status
+{{CLI_COMMAND}} auth status
 ```
 
 ## Configuration
 
-Configuration is stored in your {cli_tool} CLI config.
+Configuration is stored in your {{CLI_COMMAND}} CLI config.
 
 ## Troubleshooting
 
 | Issue | Solution |
 |-------|----------|
-| Auth failed | Run `{cli_tool} auth login` again |
-| CLI not found | Verify installation: `which {cli_tool}` |
-| Permission denied | Check your {api_name} permissions |
-"""
-    else:
-        # Custom library setup
-        cli_name = f'{topic}-as'
-        return f"""---
-description: "Set up {api_name} Assistant Skills with credentials and configuration"
+| Auth failed | Run `{{CLI_COMMAND}} auth login` again |
+| CLI not found | Verify installation: `which {{CLI_COMMAND}}` |
+| Permission denied | Check your {{API_NAME}} permissions |
+""")
+
+_LIBRARY_SETUP_COMMAND_TEMPLATE = _compile("""---
+description: "Set up {{API_NAME}} Assistant Skills with credentials and configuration"
 user_invocable: true
 arguments:
   - name: profile
@@ -309,22 +415,22 @@ arguments:
     default: "default"
 ---
 
-# {api_name} Assistant Setup
+# {{API_NAME}} Assistant Setup
 
-Set up {api_name} Assistant Skills for Claude Code.
+Set up {{API_NAME}} Assistant Skills for Claude Code.
 
 ## Installation
 
 Install the CLI library:
 
 ```bash
-pip install {topic}-assistant-skills-lib
+pip install {{TOPIC}}-assistant-skills-lib
 ```
 
 Or install from source:
 
 ```bash
-cd {topic}-assistant-skills-lib
+cd {{TOPIC}}-assistant-skills-lib
 pip install -e .
 ```
 
@@ -334,12 +440,12 @@ Configure your API credentials:
 
 ```bash
 # Set environment variables
-export {api_name.upper().replace(' ', '_').replace('-', '_')}_API_KEY="your-api-key"
-export {api_name.upper().replace(' ', '_').replace('-', '_')}_BASE_URL="{context.get('API_URL', 'https://api.example.com')}"
+export {{API_ENV_PREFIX}}_API_KEY="your-api-key"
+export {{API_ENV_PREFIX}}_BASE_URL="{{API_URL}}"
 
 # Or use the config command
-{cli_name} config set api_key YOUR_API_KEY
-{cli_name} config set base_url {context.get('API_URL', 'https://api.example.com')}
+{{CLI_COMMAND}} config set api_key YOUR_API_KEY
+{{CLI_COMMAND}} config set base_url {{API_URL}}
 ```
 
 ## Verification
@@ -347,7 +453,7 @@ export {api_name.upper().replace(' ', '_').replace('-', '_')}_BASE_URL="{context
 Verify your setup:
 
 ```bash
-{cli_name} auth status
+{{CLI_COMMAND}} auth status
 ```
 
 ## Profiles
@@ -356,47 +462,47 @@ Use different profiles for different environments:
 
 ```bash
 # Use development profile
-{cli_name} --profile development config set base_url https://dev.api.example.com
+{{CLI_COMMAND}} --profile development config set base_url https://dev.api.example.com
 
 # Use profile in commands
-{cli_name} --profile development resource list
+{{CLI_COMMAND}} --profile development resource list
 ```
 
 ## Troubleshooting
 
 | Issue | Solution |
 |-------|----------|
-| Auth failed | Verify API key: `{cli_name} auth status` |
-| CLI not found | Verify installation: `pip show {topic}-assistant-skills-lib` |
+| Auth failed | Verify API key: `{{CLI_COMMAND}} auth status` |
+| CLI not found | Verify installation: `pip show {{TOPIC}}-assistant-skills-lib` |
 | Connection error | Check BASE_URL and network connectivity |
-"""
+""")
 
 
-def generate_browse_skills_command(context: dict) -> str:
-    """Generate browse-skills command markdown."""
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
-    skills = context.get('SKILLS', [])
+def generate_setup_command(context: dict) -> str:
+    """Generate setup command markdown."""
+    if context.get('PROJECT_TYPE', 'cli-wrapper') == 'cli-wrapper':
+        template = _CLI_SETUP_COMMAND_TEMPLATE
+    else:
+        # Custom library setup
+        template = _LIBRARY_SETUP_COMMAND_TEMPLATE
+    return _render(template, _resolve(context))
 
-    skills_table = ""
-    for skill in skills:
-        skills_table += f"| {topic}-{skill} | {skill.title()} operations |\n"
 
-    return f"""---
-description: "Browse all available {api_name} skills with descriptions and examples"
+_BROWSE_SKILLS_COMMAND_TEMPLATE = _compile("""---
+description: "Browse all available {{API_NAME}} skills with descriptions and examples"
 user_invocable: true
 ---
 
-# Browse {api_name} Skills
+# Browse {{API_NAME}} Skills
 
-List all available {api_name} automation skills.
+List all available {{API_NAME}} automation skills.
 
 ## Available Skills
 
 | Skill | Description |
 |-------|-------------|
-| {topic}-assistant | Hub skill - routes to specialized skills |
-{skills_table}
+| {{TOPIC}}-assistant | Hub skill - routes to specialized skills |
+{{SKILLS_TABLE}}
 
 ## Usage
 
@@ -408,19 +514,26 @@ To use a skill, simply describe what you want to do:
 
 ## Getting Started
 
-1. Run `/{topic}-assistant-setup` to configure authentication
+1. Run `/{{TOPIC}}-assistant-setup` to configure authentication
 2. Describe your task naturally
 3. The assistant will route to the appropriate skill
-"""
+""")
 
+_BROWSE_SKILLS_ROW_TEMPLATE = _compile("| {{TOPIC}}-{{SKILL}} | {{SKILL_TITLE}} operations |\n")
 
-def generate_skill_info_command(context: dict) -> str:
-    """Generate skill-info command markdown."""
+
+def generate_browse_skills_command(context: dict) -> str:
+    """Generate browse-skills command markdown."""
     topic = context['TOPIC']
-    api_name = context['API_NAME']
+    skills = context.get('SKILLS', [])
+
+    skills_table = "".join(_skill_row(_BROWSE_SKILLS_ROW_TEMPLATE, topic, skill) for skill in skills)
+
+    return _render(_BROWSE_SKILLS_COMMAND_TEMPLATE, dict(context, SKILLS_TABLE=skills_table))
+
 
-    return f"""---
-description: "Get detailed information about a specific {api_name} skill"
+_SKILL_INFO_COMMAND_TEMPLATE = _compile("""---
+description: "Get detailed information about a specific {{API_NAME}} skill"
 user_invocable: true
 arguments:
   - name: skill_name
@@ -430,12 +543,12 @@ arguments:
 
 # Skill Information
 
-Get detailed information about a specific {api_name} skill.
+Get detailed information about a specific {{API_NAME}} skill.
 
 ## Usage
 
 ```
-/skill-info {topic}-issue
+/skill-info {{TOPIC}}-issue
 ```
 
 ## Information Provided
@@ -448,20 +561,20 @@ Get detailed information about a specific {api_name} skill.
 
 ## Example Output
 
-For `{topic}-resource`:
+For `{{TOPIC}}-resource`:
 - **Operations**: list, get, create, update, delete
 - **Risk Level**: ⚠️ (modifiable)
-- **Related**: {topic}-search, {topic}-bulk
-"""
+- **Related**: {{TOPIC}}-search, {{TOPIC}}-bulk
+""")
 
 
-def generate_conftest_py(context: dict) -> str:
-    """Generate root conftest.py with standard fixtures."""
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
+def generate_skill_info_command(context: dict) -> str:
+    """Generate skill-info command markdown."""
+    return _render(_SKILL_INFO_COMMAND_TEMPLATE, context)
 
-    return f'''"""
-Root test fixtures for {context['PROJECT_NAME']}.
+
+_CONFTEST_PY_TEMPLATE = _compile('''"""
+Root test fixtures for {{PROJECT_NAME}}.
 
 This file contains shared fixtures used across all skill tests.
 """
@@ -488,14 +601,14 @@ def temp_dir(temp_path: Path) -> str:
 
 
 @pytest.fixture
-def mock_{topic}_client():
-    """Mock {topic} client for offline testing."""
+def mock_{{TOPIC}}_client():
+    """Mock {{TOPIC}} client for offline testing."""
     from unittest.mock import MagicMock
 
     client = MagicMock()
-    client.get.return_value = {{"items": [], "total": 0}}
-    client.post.return_value = {{"id": "123", "status": "created"}}
-    client.put.return_value = {{"id": "123", "status": "updated"}}
+    client.get.return_value = {"items": [], "total": 0}
+    client.post.return_value = {"id": "123", "status": "created"}
+    client.put.return_value = {"id": "123", "status": "updated"}
     client.delete.return_value = None
 
     return client
@@ -504,13 +617,13 @@ def mock_{topic}_client():
 @pytest.fixture
 def sample_resource():
     """Sample resource data for testing."""
-    return {{
+    return {
         "id": "RESOURCE-123",
         "name": "Test Resource",
         "description": "A test resource",
         "created_at": "2024-01-01T00:00:00Z",
         "updated_at": "2024-01-01T00:00:00Z",
-    }}
+    }
 
 
 @pytest.fixture
@@ -527,11 +640,11 @@ def claude_project_structure(temp_path: Path) -> Path:
     plugin_dir.mkdir()
 
     # Create plugin.json
-    (plugin_dir / "plugin.json").write_text(\'\'\'{{
+    (plugin_dir / "plugin.json").write_text(\'\'\'{
         "name": "test-plugin",
         "version": "1.0.0",
         "skills": ["../skills/test-skill/SKILL.md"]
-    }}\'\'\')
+    }\'\'\')
 
     # Create skills directory
     skills_dir = temp_path / "skills" / "test-skill"
@@ -549,14 +662,15 @@ Test content.
 \'\'\')
 
     return temp_path
-'''
+''')
 
 
-def generate_pytest_ini(context: dict) -> str:
-    """Generate pytest.ini with markers."""
-    topic = context['TOPIC']
+def generate_conftest_py(context: dict) -> str:
+    """Generate root conftest.py with standard fixtures."""
+    return _render(_CONFTEST_PY_TEMPLATE, context)
 
-    return f"""[pytest]
+
+_PYTEST_INI_TEMPLATE = _compile("""[pytest]
 testpaths = skills tests
 pythonpath = . skills/shared/tests/live_integration
 addopts = -v --tb=short --import-mode=importlib
@@ -565,7 +679,7 @@ markers =
     # Environment markers
     unit: Unit tests (fast, no external dependencies)
     integration: Integration tests (may require setup)
-    live: Live tests against real {topic} instance
+    live: Live tests against real {{TOPIC}} instance
     e2e: End-to-end tests with Claude Code
     docker_required: Requires Docker
 
@@ -592,15 +706,16 @@ markers =
     warning: Bulk/destructive operations
 
     # Skill markers
-    {topic}_assistant: Hub/router skill tests
-"""
+    {{TOPIC}}_assistant: Hub/router skill tests
+""")
 
 
-def generate_requirements_txt(context: dict) -> str:
-    """Generate requirements.txt."""
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
+def generate_pytest_ini(context: dict) -> str:
+    """Generate pytest.ini with markers."""
+    return _render(_PYTEST_INI_TEMPLATE, context)
+
 
-    base_requirements = """# Core dependencies
+_BASE_REQUIREMENTS = """# Core dependencies
 requests>=2.28.0
 
 # Output formatting
@@ -618,90 +733,81 @@ pytest-cov>=4.0.0
 assistant-skills-lib>=0.3.0
 """
 
-    if project_type in ('custom-library', 'hybrid'):
-        topic = context['TOPIC']
-        base_requirements += f"""
+_LIBRARY_REQUIREMENTS_TEMPLATE = _compile("""
 # Project CLI library (install in editable mode during development)
-# pip install -e ./{topic}-assistant-skills-lib/
-"""
-
-    return base_requirements
+# pip install -e ./{{TOPIC}}-assistant-skills-lib/
+""")
 
 
-def generate_claude_md(context: dict) -> str:
-    """Generate CLAUDE.md content."""
-    project_name = context['PROJECT_NAME']
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
-    skills = context.get('SKILLS', [])
+def generate_requirements_txt(context: dict) -> str:
+    """Generate requirements.txt."""
     project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
 
-    skills_table = ""
-    for skill in skills:
-        skills_table += f"| `{topic}-{skill}` | {skill.title()} operations | `skills/{topic}-{skill}/` |\n"
+    if project_type in _LIBRARY_PROJECT_TYPES:
+        return _BASE_REQUIREMENTS + _render(_LIBRARY_REQUIREMENTS_TEMPLATE, context)
 
-    cli_section = ""
-    if project_type == 'cli-wrapper':
-        cli_tool = context.get('CLI_TOOL', topic)
-        cli_section = f"""
+    return _BASE_REQUIREMENTS
+
+
+_CLI_WRAPPER_SECTION_TEMPLATE = _compile("""
 ## CLI Tool
 
-This project wraps the `{cli_tool}` CLI tool. Skills document `{cli_tool}` commands
+This project wraps the `{{CLI_COMMAND}}` CLI tool. Skills document `{{CLI_COMMAND}}` commands
 rather than implementing custom scripts.
 
 ### Installation
 
-See `/{topic}-assistant-setup` for installation instructions.
-"""
-    else:
-        cli_name = f'{topic}-as'
-        cli_section = f"""
+See `/{{TOPIC}}-assistant-setup` for installation instructions.
+""")
+
+_CLI_LIBRARY_SECTION_TEMPLATE = _compile("""
 ## CLI Library
 
-This project includes a custom CLI library: `{topic}-assistant-skills-lib/`
+This project includes a custom CLI library: `{{TOPIC}}-assistant-skills-lib/`
 
 ### Installation
 
 ```bash
-pip install -e ./{topic}-assistant-skills-lib/
+pip install -e ./{{TOPIC}}-assistant-skills-lib/
 ```
 
 ### Usage
 
 ```bash
-{cli_name} --help
-{cli_name} resource list
-{cli_name} resource get RESOURCE-123
+{{CLI_COMMAND}} --help
+{{CLI_COMMAND}} resource list
+{{CLI_COMMAND}} resource get RESOURCE-123
 ```
-"""
+""")
 
-    return f"""# {project_name}
+# Split around the skills table so the writer can emit the parts with one writev
+_CLAUDE_MD_PARTS = _split(_compile("""# {{PROJECT_NAME}}
 
-Claude Code guidance for the {project_name} project.
+Claude Code guidance for the {{PROJECT_NAME}} project.
 
 ## Overview
 
-This project provides Claude Code skills for interacting with {api_name}.
-{cli_section}
+This project provides Claude Code skills for interacting with {{API_NAME}}.
+{{CLI_SECTION}}
 
 ## Available Skills
 
 | Skill | Purpose | Location |
 |-------|---------|----------|
-| `{topic}-assistant` | Hub skill - routes to specialized skills | `skills/{topic}-assistant/` |
-{skills_table}
+| `{{TOPIC}}-assistant` | Hub skill - routes to specialized skills | `skills/{{TOPIC}}-assistant/` |
+{{SKILLS_TABLE}}
 
 ## Project Structure
 
 ```
-{project_name}/
+{{PROJECT_NAME}}/
 ├── .claude-plugin/           # Plugin manifest and commands
 │   ├── plugin.json          # Plugin definition
 │   ├── marketplace.json     # Marketplace registry
 │   └── commands/            # Slash commands
 ├── skills/                   # Skill documentation
-│   ├── {topic}-assistant/   # Hub/router skill
-│   ├── {topic}-*/           # Feature skills
+│   ├── {{TOPIC}}-assistant/   # Hub/router skill
+│   ├── {{TOPIC}}-*/           # Feature skills
 │   └── shared/              # Shared docs and config
 ├── conftest.py              # Root test fixtures
 ├── pytest.ini               # Test configuration
@@ -725,7 +831,7 @@ Configuration priority:
 pytest skills/ -v
 
 # Specific skill
-pytest skills/{topic}-issue/tests/ -v
+pytest skills/{{TOPIC}}-issue/tests/ -v
 
 # Skip destructive tests
 pytest skills/ -v -m "not destructive"
@@ -779,72 +885,87 @@ To update version:
 ```bash
 echo "2.0.0" > VERSION
 ```
-"""
+"""), 'SKILLS_TABLE')
 
+_CLAUDE_MD_SKILL_ROW_TEMPLATE = _compile(
+    "| `{{TOPIC}}-{{SKILL}}` | {{SKILL_TITLE}} operations | `skills/{{TOPIC}}-{{SKILL}}/` |\n"
+)
 
-def generate_readme(context: dict) -> str:
-    """Generate README.md content."""
-    project_name = context['PROJECT_NAME']
+
+def _claude_md_parts(context: dict) -> tuple:
+    """Render CLAUDE.md as (head, skills table, tail)."""
     topic = context['TOPIC']
-    api_name = context['API_NAME']
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
+    skills = context.get('SKILLS', [])
+    context = _resolve(context)
 
-    install_section = ""
-    if project_type == 'cli-wrapper':
-        cli_tool = context.get('CLI_TOOL', topic)
-        cli_install = context.get('CLI_INSTALL', f'brew install {cli_tool}')
-        install_section = f"""
+    skills_table = "".join(_skill_row(_CLAUDE_MD_SKILL_ROW_TEMPLATE, topic, skill) for skill in skills)
+
+    if context.get('PROJECT_TYPE', 'cli-wrapper') == 'cli-wrapper':
+        cli_section = _render(_CLI_WRAPPER_SECTION_TEMPLATE, context)
+    else:
+        cli_section = _render(_CLI_LIBRARY_SECTION_TEMPLATE, context)
+
+    values = dict(context, CLI_SECTION=cli_section)
+    head, tail = _CLAUDE_MD_PARTS
+    return _render(head, values), skills_table, _render(tail, values)
+
+
+def generate_claude_md(context: dict) -> str:
+    """Generate CLAUDE.md content."""
+    return ''.join(_claude_md_parts(context))
+
+
+_CLI_INSTALL_SECTION_TEMPLATE = _compile("""
 ### 1. Install CLI
 
 ```bash
-{cli_install}
+{{CLI_INSTALL}}
 ```
 
 ### 2. Authenticate
 
 ```bash
-{cli_tool} auth login
+{{CLI_COMMAND}} auth login
 ```
-"""
-    else:
-        cli_name = f'{topic}-as'
-        install_section = f"""
+""")
+
+_LIBRARY_INSTALL_SECTION_TEMPLATE = _compile("""
 ### 1. Install Library
 
 ```bash
-pip install {topic}-assistant-skills-lib
+pip install {{TOPIC}}-assistant-skills-lib
 ```
 
 Or from source:
 
 ```bash
-pip install -e ./{topic}-assistant-skills-lib/
+pip install -e ./{{TOPIC}}-assistant-skills-lib/
 ```
 
 ### 2. Configure
 
 ```bash
-export {api_name.upper().replace(' ', '_').replace('-', '_')}_API_KEY="your-api-key"
+export {{API_ENV_PREFIX}}_API_KEY="your-api-key"
 ```
-"""
+""")
 
-    return f"""# {project_name}
+_README_TEMPLATE = _compile("""# {{PROJECT_NAME}}
 
-Claude Code Assistant Skills for {api_name}.
+Claude Code Assistant Skills for {{API_NAME}}.
 
 ## Quick Start
-{install_section}
+{{INSTALL_SECTION}}
 ### 3. Load in Claude Code
 
 ```
-/load {topic}
+/load {{TOPIC}}
 ```
 
 ## Available Skills
 
 | Skill | Description |
 |-------|-------------|
-| `{topic}-assistant` | Hub skill for routing to specialized skills |
+| `{{TOPIC}}-assistant` | Hub skill for routing to specialized skills |
 
 ## Configuration
 
@@ -867,52 +988,41 @@ python -m assistant_builder.validate_project .
 ## License
 
 MIT License
-"""
+""")
 
 
-def generate_router_skill_md(context: dict) -> str:
-    """Generate SKILL.md for the router/assistant skill."""
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
-    skills = context.get('SKILLS', [])
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
-    cli_tool = context.get('CLI_TOOL', topic) if project_type == 'cli-wrapper' else f'{topic}-as'
+def generate_readme(context: dict) -> str:
+    """Generate README.md content."""
+    context = _resolve(context)
 
-    # Build routing table
-    routing_table = ""
-    for skill in skills:
-        routing_table += f"| {skill.title()} operations | `{topic}-{skill}` | ⚠️ |\n"
+    if context.get('PROJECT_TYPE', 'cli-wrapper') == 'cli-wrapper':
+        install_section = _render(_CLI_INSTALL_SECTION_TEMPLATE, context)
+    else:
+        install_section = _render(_LIBRARY_INSTALL_SECTION_TEMPLATE, context)
 
-    # Build skills overview
-    skills_overview = ""
-    for skill in skills:
-        skills_overview += f"""
-### {topic}-{skill}
+    return _render(_README_TEMPLATE, dict(context, INSTALL_SECTION=install_section))
 
-- **Purpose**: {skill.title()} operations
-- **Risk**: ⚠️ (modifiable)
-- **Triggers**: {skill}, {skill}s, manage {skill}
-"""
 
-    return f"""---
-name: "{topic}-assistant"
-description: "{api_name} automation hub. Routes requests to specialized skills. ALWAYS use this skill when: (1) any {api_name} operation, (2) unsure which skill to use, (3) multi-step {api_name} workflows. Start here for any {topic} task."
+# Split around the routing table and skills overview, like CLAUDE.md
+_ROUTER_SKILL_MD_PARTS = _split(_compile("""---
+name: "{{TOPIC}}-assistant"
+description: "{{API_NAME}} automation hub. Routes requests to specialized skills. ALWAYS use this skill when: (1) any {{API_NAME}} operation, (2) unsure which skill to use, (3) multi-step {{API_NAME}} workflows. Start here for any {{TOPIC}} task."
 version: "1.0.0"
-author: "{context['PROJECT_NAME']}"
+author: "{{PROJECT_NAME}}"
 license: "MIT"
 allowed-tools: ["Bash", "Read", "Glob", "Grep"]
 ---
 
-# {api_name} Assistant
+# {{API_NAME}} Assistant
 
-Central hub for {api_name} automation. Routes requests to the most appropriate specialized skill.
+Central hub for {{API_NAME}} automation. Routes requests to the most appropriate specialized skill.
 
 ## Quick Reference
 
 | I want to... | Use this skill | Risk |
 |--------------|----------------|:----:|
-| Search/list/query | {topic}-search | - |
-{routing_table}| Bulk operations on 10+ items | {topic}-bulk | ⚠️⚠️ |
+| Search/list/query | {{TOPIC}}-search | - |
+{{ROUTING_TABLE}}| Bulk operations on 10+ items | {{TOPIC}}-bulk | ⚠️⚠️ |
 
 **Risk Legend**: - Safe | ⚠️ Caution | ⚠️⚠️ Warning | ⚠️⚠️⚠️ Danger
 
@@ -922,38 +1032,38 @@ Central hub for {api_name} automation. Routes requests to the most appropriate s
 
 If user explicitly mentions a skill name, route to that skill.
 
-- "use {topic}-search" → {topic}-search
-- "run the bulk skill" → {topic}-bulk
+- "use {{TOPIC}}-search" → {{TOPIC}}-search
+- "run the bulk skill" → {{TOPIC}}-bulk
 
 ### Rule 2: Entity Signals
 
 | Signal | Route to |
 |--------|----------|
-| Item ID (e.g., ITEM-123) | {topic}-resource |
-| Query/filter expression | {topic}-search |
-| "bulk", "batch", "multiple" | {topic}-bulk |
+| Item ID (e.g., ITEM-123) | {{TOPIC}}-resource |
+| Query/filter expression | {{TOPIC}}-search |
+| "bulk", "batch", "multiple" | {{TOPIC}}-bulk |
 
 ### Rule 3: Operation Type
 
 | Operation | Route to |
 |-----------|----------|
-| List, search, find, query | {topic}-search |
-| Get, show, view details | {topic}-resource |
-| Create, new, add | {topic}-resource |
-| Update, edit, modify | {topic}-resource |
-| Delete, remove | {topic}-resource |
-| Bulk create/update/delete | {topic}-bulk |
+| List, search, find, query | {{TOPIC}}-search |
+| Get, show, view details | {{TOPIC}}-resource |
+| Create, new, add | {{TOPIC}}-resource |
+| Update, edit, modify | {{TOPIC}}-resource |
+| Delete, remove | {{TOPIC}}-resource |
+| Bulk create/update/delete | {{TOPIC}}-bulk |
 
 ### Rule 4: Quantity Determines Skill
 
 | Quantity | Route to |
 |----------|----------|
-| Single item | {topic}-resource |
-| 2-10 items | {topic}-resource (loop) |
-| 10+ items | {topic}-bulk |
+| Single item | {{TOPIC}}-resource |
+| 2-10 items | {{TOPIC}}-resource (loop) |
+| 10+ items | {{TOPIC}}-bulk |
 
 ## Skills Overview
-{skills_overview}
+{{SKILLS_OVERVIEW}}
 
 ## Disambiguation
 
@@ -966,15 +1076,15 @@ When request is ambiguous, ask for clarification:
 
 ## Connection Verification
 
-Before any operation, verify {api_name} is configured:
+Before any operation, verify {{API_NAME}} is configured:
 
 ```bash
-{cli_tool} auth status
+{{CLI_COMMAND}} auth status
 ```
 
 If not authenticated:
 ```bash
-{cli_tool} auth login
+{{CLI_COMMAND}} auth login
 ```
 
 ## Related Documentation
@@ -982,93 +1092,121 @@ If not authenticated:
 - [Decision Tree](./docs/DECISION_TREE.md)
 - [Safeguards](../shared/docs/SAFEGUARDS.md)
 - [Quick Reference](../shared/docs/QUICK_REFERENCE.md)
-"""
+"""), 'ROUTING_TABLE', 'SKILLS_OVERVIEW')
 
+_ROUTING_ROW_TEMPLATE = _compile("| {{SKILL_TITLE}} operations | `{{TOPIC}}-{{SKILL}}` | ⚠️ |\n")
 
-def generate_skill_md(context: dict, skill_name: str) -> str:
-    """Generate SKILL.md for a specific skill."""
+_SKILL_OVERVIEW_TEMPLATE = _compile("""
+### {{TOPIC}}-{{SKILL}}
+
+- **Purpose**: {{SKILL_TITLE}} operations
+- **Risk**: ⚠️ (modifiable)
+- **Triggers**: {{SKILL}}, {{SKILL}}s, manage {{SKILL}}
+""")
+
+
+def _router_skill_md_parts(context: dict) -> tuple:
+    """Render the router SKILL.md as text parts around its two per-skill tables."""
     topic = context['TOPIC']
-    api_name = context['API_NAME']
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
-    cli_tool = context.get('CLI_TOOL', topic) if project_type == 'cli-wrapper' else f'{topic}-as'
+    skills = context.get('SKILLS', [])
+
+    # Build routing table
+    routing_table = "".join(_skill_row(_ROUTING_ROW_TEMPLATE, topic, skill) for skill in skills)
+
+    # Build skills overview
+    skills_overview = "".join(_skill_row(_SKILL_OVERVIEW_TEMPLATE, topic, skill) for skill in skills)
+
+    values = _resolve(context)
+    head, middle, tail = _ROUTER_SKILL_MD_PARTS
+    return (
+        _render(head, values), routing_table,
+        _render(middle, values), skills_overview,
+        _render(tail, values),
+    )
 
-    return f"""---
-name: "{topic}-{skill_name}"
-description: "{api_name} {skill_name} operations. ALWAYS use this skill when user wants to: (1) list {skill_name}s, (2) get {skill_name} details, (3) create new {skill_name}s, (4) update existing {skill_name}s, (5) delete {skill_name}s."
+
+def generate_router_skill_md(context: dict) -> str:
+    """Generate SKILL.md for the router/assistant skill."""
+    return ''.join(_router_skill_md_parts(context))
+
+
+_SKILL_MD_TEMPLATE = _compile("""---
+name: "{{TOPIC}}-{{SKILL}}"
+description: "{{API_NAME}} {{SKILL}} operations. ALWAYS use this skill when user wants to: (1) list {{SKILL}}s, (2) get {{SKILL}} details, (3) create new {{SKILL}}s, (4) update existing {{SKILL}}s, (5) delete {{SKILL}}s."
 version: "1.0.0"
-author: "{context['PROJECT_NAME']}"
+author: "{{PROJECT_NAME}}"
 license: "MIT"
 allowed-tools: ["Bash", "Read", "Glob", "Grep"]
 ---
 
-# {skill_name.title()} Skill
+# {{SKILL_TITLE}} Skill
 
-{skill_name.title()} operations for {api_name}.
+{{SKILL_TITLE}} operations for {{API_NAME}}.
 
 ## Quick Reference
 
 | Operation | Command | Risk |
 |-----------|---------|:----:|
-| List {skill_name}s | `{cli_tool} {skill_name} list` | - |
-| Get {skill_name} | `{cli_tool} {skill_name} get <id>` | - |
-| Create {skill_name} | `{cli_tool} {skill_name} create [options]` | ⚠️ |
-| Update {skill_name} | `{cli_tool} {skill_name} update <id> [options]` | ⚠️ |
-| Delete {skill_name} | `{cli_tool} {skill_name} delete <id>` | ⚠️⚠️ |
+| List {{SKILL}}s | `{{CLI_COMMAND}} {{SKILL}} list` | - |
+| Get {{SKILL}} | `{{CLI_COMMAND}} {{SKILL}} get <id>` | - |
+| Create {{SKILL}} | `{{CLI_COMMAND}} {{SKILL}} create [options]` | ⚠️ |
+| Update {{SKILL}} | `{{CLI_COMMAND}} {{SKILL}} update <id> [options]` | ⚠️ |
+| Delete {{SKILL}} | `{{CLI_COMMAND}} {{SKILL}} delete <id>` | ⚠️⚠️ |
 
 **Risk Legend**: - Safe | ⚠️ Caution | ⚠️⚠️ Warning | ⚠️⚠️⚠️ Danger
 
 ## When to Use This Skill
 
 **ALWAYS use when:**
-- User wants to work with {skill_name}s
-- User mentions "{skill_name}", "{skill_name}s", or related terms
+- User wants to work with {{SKILL}}s
+- User mentions "{{SKILL}}", "{{SKILL}}s", or related terms
 
 **NEVER use when:**
-- User wants bulk operations on 10+ items (use {topic}-bulk instead)
-- User is searching/querying (use {topic}-search instead)
+- User wants bulk operations on 10+ items (use {{TOPIC}}-bulk instead)
+- User is searching/querying (use {{TOPIC}}-search instead)
 
 ## Available Commands
 
-### List {skill_name.title()}s
+### List {{SKILL_TITLE}}s
 
 ```bash
-{cli_tool} {skill_name} list [--filter <query>] [--output json|table]
+{{CLI_COMMAND}} {{SKILL}} list [--filter <query>] [--output json|table]
 ```
 
 **Examples:**
 ```bash
-# List all {skill_name}s
-{cli_tool} {skill_name} list
+# List all {{SKILL}}s
+{{CLI_COMMAND}} {{SKILL}} list
 
 # Filter by status
-{cli_tool} {skill_name} list --filter "status=active"
+{{CLI_COMMAND}} {{SKILL}} list --filter "status=active"
 
 # JSON output for scripting
-{cli_tool} {skill_name} list --output json
+{{CLI_COMMAND}} {{SKILL}} list --output json
 ```
 
-### Get {skill_name.title()} Details
+### Get {{SKILL_TITLE}} Details
 
 ```bash
-{cli_tool} {skill_name} get <id> [--output json|table]
+{{CLI_COMMAND}} {{SKILL}} get <id> [--output json|table]
 ```
 
-### Create {skill_name.title()}
+### Create {{SKILL_TITLE}}
 
 ```bash
-{cli_tool} {skill_name} create --name <name> [--description <desc>]
+{{CLI_COMMAND}} {{SKILL}} create --name <name> [--description <desc>]
 ```
 
-### Update {skill_name.title()}
+### Update {{SKILL_TITLE}}
 
 ```bash
-{cli_tool} {skill_name} update <id> [--name <name>] [--description <desc>]
+{{CLI_COMMAND}} {{SKILL}} update <id> [--name <name>] [--description <desc>]
 ```
 
-### Delete {skill_name.title()}
+### Delete {{SKILL_TITLE}}
 
 ```bash
-{cli_tool} {skill_name} delete <id> [--force]
+{{CLI_COMMAND}} {{SKILL}} delete <id> [--force]
 ```
 
 ## Common Patterns
@@ -1077,38 +1215,38 @@ allowed-tools: ["Bash", "Read", "Glob", "Grep"]
 
 ```bash
 # Step 1: List to find the item
-{cli_tool} {skill_name} list --filter "name=example"
+{{CLI_COMMAND}} {{SKILL}} list --filter "name=example"
 
 # Step 2: Get details
-{cli_tool} {skill_name} get ITEM-123
+{{CLI_COMMAND}} {{SKILL}} get ITEM-123
 
 # Step 3: Update if needed
-{cli_tool} {skill_name} update ITEM-123 --status completed
+{{CLI_COMMAND}} {{SKILL}} update ITEM-123 --status completed
 ```
 
 ## Troubleshooting
 
 | Issue | Cause | Solution |
 |-------|-------|----------|
-| Authentication failed | Invalid token | Run `{cli_tool} auth login` |
-| Resource not found | Invalid ID | Verify ID with `{cli_tool} {skill_name} list` |
-| Permission denied | Insufficient rights | Check your {api_name} permissions |
+| Authentication failed | Invalid token | Run `{{CLI_COMMAND}} auth login` |
+| Resource not found | Invalid ID | Verify ID with `{{CLI_COMMAND}} {{SKILL}} list` |
+| Permission denied | Insufficient rights | Check your {{API_NAME}} permissions |
 
 ## Related Documentation
 
 - [Best Practices](./docs/BEST_PRACTICES.md)
 - [Safeguards](../shared/docs/SAFEGUARDS.md)
-"""
+""")
 
 
-def generate_safeguards_md(context: dict) -> str:
-    """Generate SAFEGUARDS.md template."""
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
-    cli_tool = context.get('CLI_TOOL', topic) if project_type == 'cli-wrapper' else f'{topic}-as'
+def generate_skill_md(context: dict, skill_name: str) -> str:
+    """Generate SKILL.md for a specific skill."""
+    return _render(_SKILL_MD_TEMPLATE, dict(
+        _resolve(context), SKILL=skill_name, SKILL_TITLE=skill_name.title()
+    ))
 
-    return f"""# Safeguards & Recovery Procedures
+
+_SAFEGUARDS_MD_TEMPLATE = _compile("""# Safeguards & Recovery Procedures
 
 ## Risk Level Matrix
 
@@ -1154,8 +1292,8 @@ def generate_safeguards_md(context: dict) -> str:
 
 ### Authentication Issues
 
-1. Verify credentials: `{cli_tool} auth status`
-2. Re-authenticate: `{cli_tool} auth login`
+1. Verify credentials: `{{CLI_COMMAND}} auth status`
+2. Re-authenticate: `{{CLI_COMMAND}} auth login`
 3. Check token expiration
 4. Verify API endpoint connectivity
 
@@ -1163,17 +1301,18 @@ def generate_safeguards_md(context: dict) -> str:
 
 | Issue | Contact |
 |-------|---------|
-| API outage | Check {api_name} status page |
+| API outage | Check {{API_NAME}} status page |
 | Security incident | Contact security team |
 | Data loss | Contact backup administrator |
-"""
+""")
 
 
-def generate_decision_tree_md(context: dict) -> str:
-    """Generate DECISION_TREE.md template."""
-    topic = context['TOPIC']
+def generate_safeguards_md(context: dict) -> str:
+    """Generate SAFEGUARDS.md template."""
+    return _render(_SAFEGUARDS_MD_TEMPLATE, _resolve(context))
 
-    return f"""# Skill Routing Decision Tree
+
+_DECISION_TREE_MD_TEMPLATE = _compile("""# Skill Routing Decision Tree
 
 ## Primary Decision: What does the user want to do?
 
@@ -1182,15 +1321,15 @@ User Request
     │
     ├─ Mentions specific skill? ──────► Use that skill
     │
-    ├─ Search/query/find? ────────────► {topic}-search
+    ├─ Search/query/find? ────────────► {{TOPIC}}-search
     │
-    ├─ Single item CRUD? ─────────────► {topic}-resource
+    ├─ Single item CRUD? ─────────────► {{TOPIC}}-resource
     │   ├─ Create
     │   ├─ Read/Get
     │   ├─ Update
     │   └─ Delete
     │
-    ├─ Multiple items (10+)? ─────────► {topic}-bulk
+    ├─ Multiple items (10+)? ─────────► {{TOPIC}}-bulk
     │   └─ "bulk", "batch", "all"
     │
     └─ Ambiguous? ────────────────────► Ask for clarification
@@ -1200,12 +1339,12 @@ User Request
 
 | Keywords | Route to |
 |----------|----------|
-| search, find, query, list, filter | {topic}-search |
-| create, new, add, make | {topic}-resource |
-| get, show, view, display | {topic}-resource |
-| update, edit, modify, change | {topic}-resource |
-| delete, remove, destroy | {topic}-resource |
-| bulk, batch, mass, multiple | {topic}-bulk |
+| search, find, query, list, filter | {{TOPIC}}-search |
+| create, new, add, make | {{TOPIC}}-resource |
+| get, show, view, display | {{TOPIC}}-resource |
+| update, edit, modify, change | {{TOPIC}}-resource |
+| delete, remove, destroy | {{TOPIC}}-resource |
+| bulk, batch, mass, multiple | {{TOPIC}}-bulk |
 
 ## Context-Based Routing
 
@@ -1222,70 +1361,68 @@ When unclear, ask:
 - "How many items are you working with?"
 - "Do you want to search or view a specific item?"
 - "Should I use bulk operations for this?"
-"""
+""")
 
 
-def generate_quick_reference_md(context: dict) -> str:
-    """Generate QUICK_REFERENCE.md template."""
-    topic = context['TOPIC']
-    api_name = context['API_NAME']
-    project_type = context.get('PROJECT_TYPE', 'cli-wrapper')
-    cli_tool = context.get('CLI_TOOL', topic) if project_type == 'cli-wrapper' else f'{topic}-as'
+def generate_decision_tree_md(context: dict) -> str:
+    """Generate DECISION_TREE.md template."""
+    return _render(_DECISION_TREE_MD_TEMPLATE, context)
 
-    return f"""# Quick Reference
+
+_QUICK_REFERENCE_MD_TEMPLATE = _compile("""# Quick Reference
 
 ## Connection
 
 ```bash
 # Check connection
-{cli_tool} auth status
+{{CLI_COMMAND}} auth status
 
 # Login
-{cli_tool} auth login
+{{CLI_COMMAND}} auth login
 ```
 
 ## Common Operations
 
 ### Search & List
 ```bash
-{cli_tool} resource list
-{cli_tool} resource list --filter "status=active"
-{cli_tool} resource list --output json
+{{CLI_COMMAND}} resource list
+{{CLI_COMMAND}} resource list --filter "status=active"
+{{CLI_COMMAND}} resource list --output json
 ```
 
 ### Get Details
 ```bash
-{cli_tool} resource get <id>
-{cli_tool} resource get <id> --output json
+{{CLI_COMMAND}} resource get <id>
+{{CLI_COMMAND}} resource get <id> --output json
 ```
 
 ### Create
 ```bash
-{cli_tool} resource create --name "Name" --description "Desc"
+{{CLI_COMMAND}} resource create --name "Name" --description "Desc"
 ```
 
 ### Update
 ```bash
-{cli_tool} resource update <id> --name "New Name"
+{{CLI_COMMAND}} resource update <id> --name "New Name"
 ```
 
 ### Delete
 ```bash
-{cli_tool} resource delete <id>
-{cli_tool} resource delete <id> --force  # Skip confirmation
+{{CLI_COMMAND}} resource delete <id>
+{{CLI_COMMAND}} resource delete <id> --force  # Skip confirmation
 ```
 
 ## Bulk Operations
 
 ```bash
 # Dry-run first
-{cli_tool} bulk update --filter "status=old" --set status=new --dry-run
+{{CLI_COMMAND}} bulk update --filter "status=old" --set status=new --dry-run
 
 # Execute with confirmation
-{cli_tool} bulk update --filter "status=old" --set status=new
+{{CLI_COMMAND}} bulk update --filter "status=old" --set status=new
 
 # With checkpoint for large batches
-{cli_tool} bulk update --filter "status=old" --set status=new --enable-checkpoint
+{{CLI_COMMAND}} bulk update --filter "status=old" --set status=new --enable-checkpoint
 ```
 
 ## Output Formats
@@ -1300,12 +1437,141 @@ def generate_quick_reference_md(context: dict) -> str:
 
 | Code | Meaning | Solution |
 |------|---------|----------|
-| 401 | Auth failed | Re-run `{cli_tool} auth login` |
+| 401 | Auth failed | Re-run `{{CLI_COMMAND}} auth login` |
 | 403 | Permission denied | Check access rights |
 | 404 | Not found | Verify resource ID |
 | 429 | Rate limited | Wait and retry |
-| 5xx | Server error | Check {api_name} status |
-"""
+| 5xx | Server error | Check {{API_NAME}} status |
+""")
+
+
+def generate_quick_reference_md(context: dict) -> str:
+    """Generate QUICK_REFERENCE.md template."""
+    return _render(_QUICK_REFERENCE_MD_TEMPLATE, _resolve(context))
+
+
+def _write_file(path: str, data):
+    """
+    Write data with raw os.open/os.write: one open, one write, one close.
+
+    data is bytes, or a tuple of bytes parts that go out in a single
+    os.writev call where the platform has one.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if not isinstance(data, bytes):
+            written = os.writev(fd, data) if _HAS_WRITEV else 0
+            if written == sum(map(len, data)):
+                return
+            data = b''.join(data)[written:]
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _to_bytes(content):
+    """Encode str content, or each part of a tuple of str parts, as UTF-8."""
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, str):
+        return content.encode('utf-8')
+    return tuple(part.encode('utf-8') for part in content)
+
+
+def _write_all(output_path: str, paths: list, contents: list, parallel: bool = True) -> list:
+    """
+    Write contents[i] to paths[i], relative to output_path.
+
+    Each content is bytes, or a callable that renders it (str or a tuple of str
+    parts) on demand.
+
+    Parent directories must already exist (create_directory_structure makes
+    them). The writes are independent and run on a small thread pool unless
+    parallel is False. Nothing is fsynced; returns the written paths.
+    """
+    prefix = output_path + os.sep
+    # Encode up front so the writers only make syscalls
+    items = [
+        (prefix + file_path, _to_bytes(content() if callable(content) else content))
+        for file_path, content in zip(paths, contents)
+    ]
+
+    if not parallel:
+        for path, data in items:
+            _write_file(path, data)
+    else:
+        # Overlap the open/write/close latency of the files. Imported here so dry
+        # runs and template-only callers never load concurrent.futures.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(items) or 1)) as executor:
+            list(executor.map(lambda item: _write_file(*item), items))
+
+    return [path for path, _ in items]
+
+
+# os.fsync needs a writable handle on Windows; POSIX can sync read-only
+# handles, which is the only way to open a directory
+_FSYNC_OPEN_FLAGS = os.O_RDONLY if os.name == 'posix' else os.O_RDWR
+
+
+def _fsync(path: str):
+    """fsync one file or directory by path."""
+    fd = os.open(path, _FSYNC_OPEN_FLAGS)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_all(paths: list, directories: list):
+    """
+    Flush written files, then every directory that gained an entry, to stable storage.
+
+    directories lists the created directories plus the one holding the
+    topmost of them, so new subdirectories are durable as well as files.
+    Runs once after every file is written, so the kernel can coalesce the
+    writeback instead of syncing file by file.
+    """
+    for path in paths:
+        _fsync(path)
+    # Directory handles can only be opened for fsync on POSIX
+    if os.name == 'posix':
+        directories = {*directories, *(os.path.dirname(path) for path in paths)}
+        # Deepest first, so a directory's entries are flushed before its own entry
+        for directory in sorted(directories, key=len, reverse=True):
+            _fsync(directory)
+
+
+# Files every project gets: (path, static bytes or generator taking the context).
+# Paths are str.format templates over {topic}.
+_FILE_SPECS = (
+    # Root files
+    ('.gitignore', _GITIGNORE_BYTES),
+    ('VERSION', _VERSION_BYTES),
+    ('README.md', generate_readme),
+    ('CLAUDE.md', _claude_md_parts),
+    ('requirements.txt', generate_requirements_txt),
+    ('conftest.py', generate_conftest_py),
+    ('pytest.ini', generate_pytest_ini),
+
+    # Plugin files
+    ('.claude-plugin/plugin.json', generate_plugin_json),
+    ('.claude-plugin/marketplace.json', generate_marketplace_json),
+    ('.claude-plugin/commands/{topic}-assistant-setup.md', generate_setup_command),
+    ('.claude-plugin/commands/browse-skills.md', generate_browse_skills_command),
+    ('.claude-plugin/commands/skill-info.md', generate_skill_info_command),
+
+    # Router skill
+    ('skills/{topic}-assistant/SKILL.md', _router_skill_md_parts),
+    ('skills/{topic}-assistant/docs/DECISION_TREE.md', generate_decision_tree_md),
+
+    # Shared documentation
+    ('skills/shared/docs/SAFEGUARDS.md', generate_safeguards_md),
+    ('skills/shared/docs/QUICK_REFERENCE.md', generate_quick_reference_md),
+)
 
 
 def scaffold_project(
@@ -1320,34 +1586,51 @@ def scaffold_project(
     auth_method: str = 'api_key',
     pagination_style: str = 'offset',
     output_dir: str = '.',
-    dry_run: bool = False
+    dry_run: bool = False,
+    parallel: bool = True,
+    fsync: bool = False
 ) -> dict:
     """
     Create a new Assistant Skills project.
 
-    Returns dict with created files and directories.
+    Returns dict with created files and directories. With parallel=False
+    files are written one at a time, in order. Files are not fsynced unless
+    fsync is True, in which case they are all flushed once at the end.
     """
+    # Exact choices are set lookups; validate_choice only sees values to normalize or reject
+    if project_type not in _PROJECT_TYPES_SET:
+        project_type = validate_choice(project_type, PROJECT_TYPES, "project type")
+    if auth_method not in _AUTH_METHODS_SET:
+        auth_method = validate_choice(auth_method, AUTH_METHODS, "auth method")
+    if pagination_style not in _PAGINATION_STYLES_SET:
+        pagination_style = validate_choice(pagination_style, PAGINATION_STYLES, "pagination style")
+
     # Prepare context
     context = {
         'PROJECT_NAME': name,
         'TOPIC': topic,
         'API_NAME': api_name,
+        'API_ENV_PREFIX': api_name.upper().translate(_ENV_SEPARATORS),
         'PROJECT_TYPE': project_type,
         'API_URL': base_url or 'https://api.example.com',
         'BASE_URL': base_url or 'https://api.example.com',
         'CLI_TOOL': cli_tool or topic,
+        'CLI_COMMAND': (cli_tool or topic) if project_type == 'cli-wrapper' else f'{topic}-as',
         'CLI_INSTALL': cli_install or f'brew install {cli_tool or topic}',
         'AUTH_METHOD': auth_method,
         'PAGINATION_STYLE': pagination_style,
-        'SKILLS': skills or [],
-        'DATE': datetime.now().isoformat()
+        'SKILLS': skills or []
     }
 
-    # Determine output path
-    output_path = Path(output_dir).expanduser().resolve() / name
+    # Determine output path; abspath normalizes without the readlink/stat calls of resolve()
+    output_path = Path(os.path.abspath(os.path.expanduser(output_dir))) / name
 
-    if output_path.exists() and not dry_run:
-        raise ValueError(f"Directory already exists: {output_path}")
+    if not dry_run:
+        # Test and create in one step: makedirs fails only if the project directory exists
+        try:
+            os.makedirs(output_path)
+        except FileExistsError:
+            raise ValueError(f"Directory already exists: {output_path}") from None
 
     result = {
         'path': str(output_path),
@@ -1357,84 +1640,71 @@ def scaffold_project(
     }
 
     # Create directory structure
-    if not dry_run:
-        output_path.mkdir(parents=True, exist_ok=True)
-
     result['directories'] = create_directory_structure(
         output_path, topic, skills or [], project_type, dry_run
     )
 
-    # Generate files
-    files_to_create = [
-        # Root files
-        ('.gitignore', generate_gitignore(context)),
-        ('VERSION', generate_version_file(context)),
-        ('README.md', generate_readme(context)),
-        ('CLAUDE.md', generate_claude_md(context)),
-        ('requirements.txt', generate_requirements_txt(context)),
-        ('conftest.py', generate_conftest_py(context)),
-        ('pytest.ini', generate_pytest_ini(context)),
-
-        # Plugin files
-        ('.claude-plugin/plugin.json', generate_plugin_json(context)),
-        ('.claude-plugin/marketplace.json', generate_marketplace_json(context)),
-        (f'.claude-plugin/commands/{topic}-assistant-setup.md', generate_setup_command(context)),
-        ('.claude-plugin/commands/browse-skills.md', generate_browse_skills_command(context)),
-        ('.claude-plugin/commands/skill-info.md', generate_skill_info_command(context)),
-
-        # Router skill
-        (f'skills/{topic}-assistant/SKILL.md', generate_router_skill_md(context)),
-        (f'skills/{topic}-assistant/docs/DECISION_TREE.md', generate_decision_tree_md(context)),
-
-        # Shared documentation
-        ('skills/shared/docs/SAFEGUARDS.md', generate_safeguards_md(context)),
-        ('skills/shared/docs/QUICK_REFERENCE.md', generate_quick_reference_md(context)),
+    # Content is rendered only when written; dry runs never call the generators.
+    # Paths and contents are kept as parallel lists; paths doubles as the result.
+    paths = [path.format(topic=topic) for path, _ in _FILE_SPECS]
+    contents = [
+        content if isinstance(content, bytes) else partial(content, context)
+        for _, content in _FILE_SPECS
     ]
 
     # Add skill files
     for skill in (skills or []):
-        files_to_create.append(
-            (f'skills/{topic}-{skill}/SKILL.md', generate_skill_md(context, skill))
-        )
+        paths.append(f'skills/{topic}-{skill}/SKILL.md')
+        contents.append(partial(generate_skill_md, context, skill))
 
     # Create files
-    for file_path, content in files_to_create:
-        full_path = output_path / file_path
-        result['files'].append(file_path)
-        if not dry_run:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content)
+    result['files'] = paths
+    if not dry_run:
+        written = _write_all(str(output_path), paths, contents, parallel=parallel)
+        if fsync:
+            project_dir = str(output_path)
+            _fsync_all(written, [
+                os.path.dirname(project_dir),
+                project_dir,
+                *(os.path.join(project_dir, d) for d in result['directories']),
+            ])
 
     return result
 
 
+# Wizard text, assembled once so each step is a single stdout write
+_RULE = "=" * 60
+_THIN_RULE = "-" * 60
+_WIZARD_BANNER = (
+    f"\n{_RULE}\n  Assistant Skills Project Wizard\n{_RULE}\n\n"
+    "Step 1: Project Type\n\n"
+    "  [1] CLI Wrapper - Wrap an existing CLI tool (glab, gh, aws, kubectl)\n"
+    "  [2] Custom Library - Build new CLI for an API (like Jira, Confluence)\n"
+    "  [3] Hybrid - Wrap CLI and extend with custom library\n"
+    "\n"
+)
+# Wizard menu number -> project type; blank or unknown input falls back to cli-wrapper
+_TYPE_CHOICES = {'1': 'cli-wrapper', '2': 'custom-library', '3': 'hybrid'}
+_AUTH_METHODS_LINE = f"\nAuthentication methods: {', '.join(AUTH_METHODS)}\n"
+_AUTH_PROMPT = f"Auth method [{AUTH_METHODS[0]}]: "
+
+
+def _write(text: str):
+    """Write a block of text to stdout and flush it."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def interactive_mode():
     """Run interactive wizard to collect project configuration."""
-    print("\n" + "=" * 60)
-    print("  Assistant Skills Project Wizard")
-    print("=" * 60 + "\n")
-
     # Step 1: Project type
-    print("Step 1: Project Type\n")
-    print("  [1] CLI Wrapper - Wrap an existing CLI tool (glab, gh, aws, kubectl)")
-    print("  [2] Custom Library - Build new CLI for an API (like Jira, Confluence)")
-    print("  [3] Hybrid - Wrap CLI and extend with custom library")
-    print()
+    _write(_WIZARD_BANNER)
 
     type_choice = input("Select project type [1]: ").strip()
-    if not type_choice or type_choice == '1':
-        project_type = 'cli-wrapper'
-    elif type_choice == '2':
-        project_type = 'custom-library'
-    elif type_choice == '3':
-        project_type = 'hybrid'
-    else:
-        project_type = 'cli-wrapper'
-
-    print(f"\nSelected: {project_type}\n")
+    project_type = _TYPE_CHOICES.get(type_choice, 'cli-wrapper')
 
     # Step 2: Project basics
-    print("Step 2: Project Basics\n")
+    _write(f"\nSelected: {project_type}\n\nStep 2: Project Basics\n\n")
 
     name = input("Project name (e.g., GitHub-Assistant-Skills): ").strip()
     name = validate_name(name, "project name")
@@ -1449,7 +1719,7 @@ def interactive_mode():
         api_name = topic.title()
 
     # Step 3: Project-type specific details
-    print(f"\nStep 3: {project_type.title()} Details\n")
+    _write(f"\nStep 3: {project_type.title()} Details\n\n")
 
     cli_tool = None
     cli_install = None
@@ -1465,18 +1735,20 @@ def interactive_mode():
         if not cli_install:
             cli_install = f'brew install {cli_tool}'
 
-    elif project_type in ('custom-library', 'hybrid'):
+    elif project_type in _LIBRARY_PROJECT_TYPES:
         base_url = input("API base URL [https://api.example.com]: ").strip()
         if not base_url:
             base_url = "https://api.example.com"
         else:
             base_url = validate_url(base_url)
 
-        print(f"\nAuthentication methods: {', '.join(AUTH_METHODS)}")
-        auth_method = input(f"Auth method [{AUTH_METHODS[0]}]: ").strip().lower()
+        _write(_AUTH_METHODS_LINE)
+        auth_method = input(_AUTH_PROMPT).strip().lower()
         if not auth_method:
             auth_method = AUTH_METHODS[0]
-        auth_method = validate_choice(auth_method, AUTH_METHODS, "auth method")
+        if auth_method not in _AUTH_METHODS_SET:
+            # Raises with the list of valid choices
+            auth_method = validate_choice(auth_method, AUTH_METHODS, "auth method")
 
         if project_type == 'hybrid':
             cli_tool = input(f"CLI tool to wrap (e.g., glab) [{topic}]: ").strip()
@@ -1484,29 +1756,33 @@ def interactive_mode():
                 cli_tool = topic
 
     # Step 4: Skills
-    print("\nStep 4: Initial Skills\n")
+    _write("\nStep 4: Initial Skills\n\n")
 
     skills_input = input("Initial skills (comma-separated, e.g., issues,repos,users): ").strip()
     skills = validate_list(skills_input, "skills", min_items=0)
 
     # Step 5: Confirmation
-    print("\n" + "-" * 60)
-    print("Configuration Summary:")
-    print("-" * 60)
-    print(f"  Project Type:  {project_type}")
-    print(f"  Project Name:  {name}")
-    print(f"  Topic Prefix:  {topic}")
-    print(f"  API Name:      {api_name}")
+    summary = [
+        "",
+        _THIN_RULE,
+        "Configuration Summary:",
+        _THIN_RULE,
+        f"  Project Type:  {project_type}",
+        f"  Project Name:  {name}",
+        f"  Topic Prefix:  {topic}",
+        f"  API Name:      {api_name}",
+    ]
     if project_type == 'cli-wrapper':
-        print(f"  CLI Tool:      {cli_tool}")
-        print(f"  CLI Install:   {cli_install}")
-    elif project_type in ('custom-library', 'hybrid'):
-        print(f"  Base URL:      {base_url}")
-        print(f"  Auth Method:   {auth_method}")
+        summary.append(f"  CLI Tool:      {cli_tool}")
+        summary.append(f"  CLI Install:   {cli_install}")
+    elif project_type in _LIBRARY_PROJECT_TYPES:
+        summary.append(f"  Base URL:      {base_url}")
+        summary.append(f"  Auth Method:   {auth_method}")
         if project_type == 'hybrid':
-            print(f"  CLI Tool:      {cli_tool}")
-    print(f"  Skills:        {', '.join(skills) if skills else '(none)'}")
-    print("-" * 60)
+            summary.append(f"  CLI Tool:      {cli_tool}")
+    summary.append(f"  Skills:        {', '.join(skills) if skills else '(none)'}")
+    summary.append(_THIN_RULE)
+    _write("\n".join(summary) + "\n")
 
     confirm = input("\nProceed with creation? [Y/n]: ").strip().lower()
     if confirm and confirm != 'y':
@@ -1572,6 +1848,10 @@ Examples:
     parser.add_argument('--output-dir', '-o', default='.', help='Output directory')
     parser.add_argument('--dry-run', '-d', action='store_true',
                         help='Preview without creating files')
+    parser.add_argument('--no-parallel', dest='parallel', action='store_false',
+                        help='Write files one at a time, in order')
+    parser.add_argument('--fsync', action='store_true',
+                        help='Flush all written files to disk once at the end')
 
     args = parser.parse_args()
 
@@ -1616,7 +1896,9 @@ Examples:
             auth_method=config.get('auth_method', 'api_key'),
             pagination_style=config.get('pagination_style', 'offset'),
             output_dir=args.output_dir,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            parallel=args.parallel,
+            fsync=args.fsync
         )
 
         # Report results
@@ -1638,7 +1920,7 @@ Examples:
         if result['project_type'] == 'cli-wrapper':
             print(f"2. Install the CLI tool: {config.get('cli_install', 'see setup command')}")
             print("3. Run authentication: see setup command")
-        elif result['project_type'] in ('custom-library', 'hybrid'):
+        elif result['project_type'] in _LIBRARY_PROJECT_TYPES:
             print(f"2. Implement the library: {config['topic']}-assistant-skills-lib/")
             print("3. Install locally: pip install -e ./{config['topic']}-assistant-skills-lib/")
 
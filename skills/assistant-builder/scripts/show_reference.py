@@ -21,7 +21,9 @@ Examples:
 
 import argparse
 import json
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from assistant_skills_lib import (
@@ -50,23 +52,45 @@ DEFAULT_PROJECTS = {
     'splunk': '~/IdeaProjects/Splunk-Assistant-Skills'
 }
 
+# Section header keywords per topic, lowercased for matching
+_SECTION_KEYWORDS = {
+    'project-structure': ('project structure', 'structure'),
+    'shared-library': ('shared library', 'shared lib'),
+    'skill-organization': ('skill', 'organization'),
+    'testing-patterns': ('testing', 'test'),
+    'skill-md': ('skill.md', 'skill'),
+    'router-skill': ('router', 'hub'),
+    'configuration': ('configuration', 'config', 'settings'),
+    'error-handling': ('error', 'exception'),
+    'client-pattern': ('client', 'http')
+}
+
+# A line starting with '#': the run of '#'s and the rest of the line. Matched
+# after a literal newline rather than with ^ in MULTILINE mode, so the regex
+# engine can skip ahead to candidate lines instead of trying every position.
+_HEADER_RE = re.compile(r'\n(#+)(.*)')
+
+_SCRIPT_DIR = Path(__file__).parent
+_REFS_DIR = _SCRIPT_DIR.parent / 'references'
+_SETTINGS_PATH = _SCRIPT_DIR.parent.parent.parent / 'settings.json'
 
+
+@lru_cache(maxsize=1)
 def load_settings():
     """Load settings.json to get reference project paths."""
-    settings_path = Path(__file__).parent.parent.parent.parent / 'settings.json'
-    if settings_path.exists():
+    if _SETTINGS_PATH.exists():
         try:
-            settings = json.loads(settings_path.read_text())
+            settings = json.loads(_SETTINGS_PATH.read_text())
             return settings.get('assistant-builder', {}).get('reference_projects', DEFAULT_PROJECTS)
         except json.JSONDecodeError:
             pass
     return DEFAULT_PROJECTS
 
 
+@lru_cache(maxsize=16)
 def get_reference_doc(project_name: str) -> str:
     """Get the reference documentation for a project."""
-    refs_dir = Path(__file__).parent.parent / 'references'
-    ref_file = refs_dir / f'{project_name}-patterns.md'
+    ref_file = _REFS_DIR / f'{project_name}-patterns.md'
 
     if ref_file.exists():
         return ref_file.read_text()
@@ -125,47 +149,33 @@ def show_topic(topic: str, project: str, projects: dict):
 
 def extract_section(content: str, topic: str) -> str:
     """Extract a section from markdown content based on topic."""
-    # Map topics to section headers
-    section_map = {
-        'project-structure': ['Project Structure', 'Structure'],
-        'shared-library': ['Shared Library', 'Shared Lib'],
-        'skill-organization': ['Skill', 'Organization'],
-        'testing-patterns': ['Testing', 'Test'],
-        'skill-md': ['SKILL.md', 'SKILL'],
-        'router-skill': ['Router', 'Hub'],
-        'configuration': ['Configuration', 'Config', 'settings'],
-        'error-handling': ['Error', 'Exception'],
-        'client-pattern': ['Client', 'HTTP']
-    }
-
-    keywords = section_map.get(topic, [topic])
-
-    lines = content.split('\n')
-    in_section = False
-    section_lines = []
-    section_level = 0
+    keywords = _SECTION_KEYWORDS.get(topic, (topic.lower(),))
 
-    for line in lines:
-        # Check for section header
-        if line.startswith('#'):
-            header_level = len(line) - len(line.lstrip('#'))
-            header_text = line.lstrip('#').strip()
-
-            # Check if this header matches our topic
-            if any(kw.lower() in header_text.lower() for kw in keywords):
-                in_section = True
-                section_level = header_level
-                section_lines = [line]
-                continue
-
-            # Check if we've hit a same-level or higher header (end of section)
-            if in_section and header_level <= section_level:
-                break
-
-        if in_section:
-            section_lines.append(line)
+    start = None
+    end = None
+    section_level = 0
 
-    return '\n'.join(section_lines) if section_lines else None
+    # The leading newline lets the first line match too, and shifts offsets so
+    # match.start() is the header's index in content
+    for match in _HEADER_RE.finditer('\n' + content):
+        header_level = len(match.group(1))
+        header_text = match.group(2).strip().lower()
+
+        # A header matching our topic (re)starts the section
+        if any(kw in header_text for kw in keywords):
+            start = match.start()
+            section_level = header_level
+            continue
+
+        # Check if we've hit a same-level or higher header (end of section)
+        if start is not None and header_level <= section_level:
+            # Drop the newline that ends the section's last line
+            end = match.start() - 1
+            break
+
+    if start is None:
+        return None
+    return content[start:end]
 
 
 def list_topics():
@@ -245,14 +245,14 @@ def validate_hub_router_skill(project_path: Path, topic: str) -> list:
 def validate_skill_md(skill_path: Path) -> list:
     """Validate SKILL.md file format."""
     issues = []
-    skill_md = skill_path / 'SKILL.md'
 
-    if not skill_md.exists():
+    # Read directly instead of stat-then-read; a missing file raises
+    try:
+        content = (skill_path / 'SKILL.md').read_text()
+    except FileNotFoundError:
         issues.append(('error', 'Missing SKILL.md'))
         return issues
 
-    content = skill_md.read_text()
-
     # Check for frontmatter
     if not content.startswith('---'):
         issues.append(('warning', 'SKILL.md missing YAML frontmatter'))
@@ -292,8 +292,37 @@ def validate_no_embedded_scripts(skill_path: Path) -> list:
     return issues
 
 
-def run_validation(project_path: str, strict: bool = False) -> dict:
-    """Run full validation on a project."""
+# Map level names to result keys
+_LEVEL_KEYS = {'error': 'errors', 'warning': 'warnings', 'info': 'info'}
+
+
+def _validate_skill(skill_dir: Path) -> dict:
+    """Collect the issues for a single skill directory."""
+    skill_issues = {
+        'errors': [],
+        'warnings': [],
+        'info': []
+    }
+
+    # Validate SKILL.md
+    for level, msg in validate_skill_md(skill_dir):
+        skill_issues[_LEVEL_KEYS[level]].append(msg)
+
+    # Check for embedded scripts
+    for level, msg in validate_no_embedded_scripts(skill_dir):
+        skill_issues[_LEVEL_KEYS[level]].append(msg)
+
+    return skill_issues
+
+
+def run_validation(project_path: str, strict: bool = False, parallel: bool = False) -> dict:
+    """
+    Run full validation on a project.
+
+    With parallel=True skills are validated on a small thread pool, which
+    overlaps their file reads on slow (e.g. network) filesystems. Results
+    keep directory order either way.
+    """
     path = Path(project_path).expanduser().resolve()
 
     result = {
@@ -367,30 +396,26 @@ def run_validation(project_path: str, strict: bool = False) -> dict:
     if not skills_dir.exists():
         skills_dir = path / '.claude' / 'skills'
 
-    # Map level names to result keys
-    level_map = {'error': 'errors', 'warning': 'warnings', 'info': 'info'}
-
     if skills_dir.exists():
-        for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir() and skill_dir.name != 'shared' and not skill_dir.name.startswith('.'):
-                skill_issues = {
-                    'errors': [],
-                    'warnings': [],
-                    'info': []
-                }
+        skill_dirs = [
+            skill_dir for skill_dir in skills_dir.iterdir()
+            if skill_dir.is_dir() and skill_dir.name != 'shared' and not skill_dir.name.startswith('.')
+        ]
 
-                # Validate SKILL.md
-                for level, msg in validate_skill_md(skill_dir):
-                    skill_issues[level_map[level]].append(msg)
+        if parallel and len(skill_dirs) > 1:
+            # Imported here so single-skill and serial runs never load concurrent.futures
+            from concurrent.futures import ThreadPoolExecutor
 
-                # Check for embedded scripts
-                for level, msg in validate_no_embedded_scripts(skill_dir):
-                    skill_issues[level_map[level]].append(msg)
+            with ThreadPoolExecutor(max_workers=min(8, len(skill_dirs))) as executor:
+                all_issues = list(executor.map(_validate_skill, skill_dirs))
+        else:
+            all_issues = [_validate_skill(skill_dir) for skill_dir in skill_dirs]
 
-                result['skills'][skill_dir.name] = skill_issues
+        for skill_dir, skill_issues in zip(skill_dirs, all_issues):
+            result['skills'][skill_dir.name] = skill_issues
 
-                if skill_issues['errors']:
-                    result['valid'] = False
+            if skill_issues['errors']:
+                result['valid'] = False
 
     # Calculate stats
     result['stats'] = calculate_stats(path, result)
@@ -526,10 +551,12 @@ Examples:
                         help='Treat warnings as errors')
     parser.add_argument('--format', '-f', choices=['text', 'json'],
                         default='text', help='Output format')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Validate skills concurrently (helps on slow filesystems)')
 
     args = parser.parse_args()
 
-    result = run_validation(args.project_dir, args.strict)
+    result = run_validation(args.project_dir, args.strict, parallel=args.parallel)
     print_validation_result(result, args.format)
 
     # Exit code
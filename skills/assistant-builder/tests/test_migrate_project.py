@@ -0,0 +1,199 @@
+"""
+Tests for migrate_project.py
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add scripts to path for importing script modules
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+
+@pytest.fixture
+def cache_home(temp_path, monkeypatch):
+    """Point the per-user cache directory at a temporary location."""
+    cache_home = temp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def old_project(sample_project):
+    """Old-structure sample project with a hub skill, so its topic is detected."""
+    project = Path(sample_project)
+    (project / ".claude" / "skills" / "test-assistant").mkdir()
+    return project
+
+
+def migrate(project, dry_run=False):
+    """Analyze, plan and execute an in-place migration."""
+    from migrate_project import analyze_project, generate_migration_plan, execute_migration
+
+    analysis = analyze_project(project)
+    plan = generate_migration_plan(analysis)
+    return execute_migration(project, project, analysis, plan, dry_run=dry_run)
+
+
+class TestCreateFiles:
+    """Tests for exclusive creation of migration files."""
+
+    def test_create_file_keeps_existing_file(self, temp_path):
+        """Test that _create_file never overwrites an existing file."""
+        from migrate_project import _create_file
+
+        target = temp_path / "VERSION"
+        assert _create_file(target, "1.0.0") is True
+        assert target.read_text() == "1.0.0"
+
+        assert _create_file(target, "2.0.0") is False
+        assert target.read_text() == "1.0.0"
+
+    def test_existing_target_is_skipped(self, old_project):
+        """Test that migration skips, and warns about, files that already exist."""
+        (old_project / "conftest.py").write_text("# mine\n")
+
+        result = migrate(old_project)
+
+        assert (old_project / "conftest.py").read_text() == "# mine\n"
+        assert "conftest.py" not in result['created_files']
+        assert "Skipping existing file: conftest.py" in result['warnings']
+        assert "pytest.ini" in result['created_files']
+
+
+class TestMoveSkills:
+    """Tests for moving .claude/skills/ to skills/."""
+
+    def test_moves_whole_tree(self, old_project):
+        """Test that the skills tree moves with a single rename."""
+        result = migrate(old_project)
+
+        assert result['moved_files'] == [('.claude/skills', 'skills')]
+        assert not (old_project / ".claude" / "skills").exists()
+        assert (old_project / "skills" / "test-sample" / "SKILL.md").exists()
+        assert (old_project / "skills" / "shared" / "scripts" / "lib").is_dir()
+
+    def test_moves_entries_when_destination_exists(self, old_project):
+        """Test the per-entry fallback when skills/ already exists."""
+        existing = old_project / "skills" / "test-sample"
+        existing.mkdir(parents=True)
+        (existing / "SKILL.md").write_text("new")
+
+        result = migrate(old_project)
+
+        assert sorted(result['moved_files']) == [
+            ('.claude/skills/shared', 'skills/shared'),
+            ('.claude/skills/test-assistant', 'skills/test-assistant'),
+        ]
+        # Colliding entries stay where they were
+        assert (existing / "SKILL.md").read_text() == "new"
+        assert (old_project / ".claude" / "skills" / "test-sample" / "SKILL.md").exists()
+        assert (old_project / "skills" / "test-assistant").is_dir()
+
+    @pytest.mark.parametrize("skills_dir_exists", [False, True])
+    def test_dry_run_matches_real_run(self, old_project, skills_dir_exists):
+        """Test that a dry run reports exactly what the real run then does."""
+        if skills_dir_exists:
+            (old_project / "skills" / "test-sample").mkdir(parents=True)
+
+        preview = migrate(old_project, dry_run=True)
+        assert (old_project / ".claude" / "skills").is_dir()
+
+        result = migrate(old_project)
+
+        for key in ('success', 'created_directories', 'created_files',
+                    'moved_files', 'errors', 'warnings'):
+            assert preview[key] == result[key], key
+
+
+class TestAnalysisCache:
+    """Tests for the opt-in analysis cache."""
+
+    def test_cache_is_opt_in(self, sample_project, cache_home):
+        """Test that nothing is cached unless use_cache is set."""
+        from migrate_project import load_analysis
+
+        load_analysis(Path(sample_project))
+
+        assert not cache_home.exists()
+
+    def test_cache_miss_then_hit(self, sample_project, cache_home, monkeypatch):
+        """Test that a second run reuses the first run's analysis."""
+        import migrate_project
+        from migrate_project import load_analysis, _analysis_cache_path
+
+        project = Path(sample_project)
+        first = load_analysis(project, use_cache=True)
+
+        cache_file = _analysis_cache_path(project)
+        assert cache_file.parent.parent == cache_home
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+        assert cache_file.parent.stat().st_mode & 0o777 == 0o700
+
+        def fail(*args, **kwargs):
+            raise AssertionError("analyze_project called on a cache hit")
+
+        monkeypatch.setattr(migrate_project, 'analyze_project', fail)
+        assert load_analysis(project, use_cache=True) == first
+
+    def test_cache_invalidated_by_project_change(self, sample_project, cache_home):
+        """Test that adding a skill invalidates the cached analysis."""
+        from migrate_project import load_analysis
+
+        project = Path(sample_project)
+        first = load_analysis(project, use_cache=True)
+        assert [s['name'] for s in first['skills']] == ['test-sample']
+
+        (project / ".claude" / "skills" / "test-other").mkdir()
+
+        second = load_analysis(project, use_cache=True)
+        assert sorted(s['name'] for s in second['skills']) == ['test-other', 'test-sample']
+
+    def test_cache_does_not_follow_symlinks(self, sample_project, cache_home, temp_path):
+        """Test that a symlink planted at the cache path is replaced, not written through."""
+        from migrate_project import load_analysis, _analysis_cache_path
+
+        project = Path(sample_project)
+        victim = temp_path / "victim.txt"
+        victim.write_text("keep me")
+
+        cache_file = _analysis_cache_path(project)
+        cache_file.parent.mkdir(parents=True)
+        cache_file.symlink_to(victim)
+
+        load_analysis(project, use_cache=True)
+
+        assert victim.read_text() == "keep me"
+        assert not cache_file.is_symlink()
+        assert not list(cache_file.parent.glob('.*.tmp'))
+
+
+class TestCopyTree:
+    """Tests for the copy-on-write project copy."""
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="FICLONE is Linux-only")
+    def test_unsupported_clone_is_tried_once(self, temp_path, monkeypatch):
+        """Test that copies fall back to copy2 without retrying FICLONE per file."""
+        import errno
+        import migrate_project
+
+        calls = []
+
+        def ioctl(*args):
+            calls.append(args)
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        monkeypatch.setattr(migrate_project.fcntl, 'ioctl', ioctl)
+        monkeypatch.setattr(migrate_project, '_clone_unsupported', False)
+
+        src = temp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        for name in ("a.txt", "b.txt", "sub/c.txt"):
+            (src / name).write_text(name)
+
+        migrate_project._copy_tree(src, temp_path / "dst")
+
+        assert len(calls) == 1
+        for name in ("a.txt", "b.txt", "sub/c.txt"):
+            assert (temp_path / "dst" / name).read_text() == name
@@ -0,0 +1,482 @@
+"""
+Tests for scaffold_library.py
+"""
+
+import importlib
+import json
+import pytest
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add scripts to path for importing script modules
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+PKG = 'my_api_assistant_skills_lib'
+
+
+@pytest.fixture(scope='module')
+def library(tmp_path_factory):
+    """Scaffold a library once and import its package."""
+    # The generated package needs its runtime dependencies
+    pytest.importorskip('click')
+    pytest.importorskip('requests')
+    from scaffold_library import scaffold_library
+
+    result = scaffold_library(
+        lib_name='my-api-lib',
+        topic='my-api',
+        api_name='My API',
+        output_dir=str(tmp_path_factory.mktemp('lib')),
+    )
+    src = str(Path(result['path']) / 'src')
+    sys.path.insert(0, src)
+    try:
+        yield importlib.import_module(PKG)
+    finally:
+        sys.path.remove(src)
+        for name in [m for m in sys.modules if m == PKG or m.startswith(PKG + '.')]:
+            del sys.modules[name]
+
+
+@pytest.fixture
+def api_env(library, temp_path, monkeypatch):
+    """Configure the generated library from the environment only."""
+    monkeypatch.setenv('HOME', str(temp_path))
+    monkeypatch.setenv('MY_API_BASE_URL', 'https://api.example.test')
+    monkeypatch.setenv('MY_API_API_KEY', 'test-key')
+
+
+@pytest.fixture
+def client(api_env):
+    """Generated client for a placeholder base URL."""
+    client = importlib.import_module(PKG + '.client').MyApiClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def server(api_env, monkeypatch):
+    """Local HTTP API answering each request with the next queued (status, body)."""
+    replies = []
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def reply(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            received.append((self.command, self.path, self.rfile.read(length)))
+            status, body = replies.pop(0)
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = reply
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    monkeypatch.setenv('MY_API_BASE_URL', f'http://127.0.0.1:{httpd.server_port}')
+    try:
+        yield SimpleNamespace(replies=replies, requests=received)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+
+
+@pytest.fixture
+def live_client(server):
+    """Generated client talking to the local server."""
+    client = importlib.import_module(PKG + '.client').MyApiClient()
+    yield client
+    client.close()
+
+
+class FakeAdapter:
+    """Transport adapter answering each request with the next canned JSON body."""
+
+    def __init__(self, bodies):
+        self.bodies = list(bodies)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        import requests
+
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.bodies.pop(0)).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def mount(client, bodies):
+    """Route the client's requests to a FakeAdapter."""
+    adapter = FakeAdapter(bodies)
+    client.session.mount('https://', adapter)
+    return adapter
+
+
+class TestConnectionPool:
+    """Tests for the generated client's pooled, retrying session."""
+
+    @pytest.mark.parametrize('scheme', ['http', 'https'])
+    def test_session_mounts_pooled_adapter(self, client, scheme):
+        """Test that both schemes share the sized pool and retry policy."""
+        from requests.adapters import HTTPAdapter
+
+        adapter = client.session.get_adapter(f'{scheme}://api.example.test')
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 20
+        assert adapter.max_retries is importlib.import_module(PKG + '.client').RETRY
+
+    @pytest.mark.parametrize('method, call', [
+        ('GET', lambda c: c.get('/things/1')),
+        ('PUT', lambda c: c.put('/things/1', data={'name': 'x'})),
+        ('DELETE', lambda c: c.delete('/things/1')),
+    ])
+    def test_idempotent_methods_are_retried(self, live_client, server, method, call):
+        """Test that a transient 5xx is retried for idempotent methods."""
+        server.replies.extend([(503, {'error': 'busy'}), (200, {'id': 1})])
+
+        assert call(live_client) == {'id': 1}
+        assert [r[0] for r in server.requests] == [method] * 2
+
+    @pytest.mark.parametrize('method', ['post', 'patch'])
+    def test_non_idempotent_methods_are_not_replayed(self, live_client, server, method):
+        """Test that POST and PATCH fail on the first 5xx instead of retrying."""
+        server.replies.append((503, {'error': 'busy'}))
+
+        with pytest.raises(importlib.import_module(PKG + '.error_handler').ServerError):
+            getattr(live_client, method)('/things', data={'name': 'x'})
+
+        assert [r[0] for r in server.requests] == [method.upper()]
+
+
+class TestBatch:
+    """Tests for the generated client's post_batch and delete_batch."""
+
+    def test_post_batch_chunks_items(self, client):
+        """Test one POST per chunk, collecting created items from any envelope."""
+        adapter = mount(client, [
+            [{'id': 1}, {'id': 2}],
+            {'items': [{'id': 3}, {'id': 4}]},
+            {'data': [{'id': 5}]},
+        ])
+        items = [{'name': str(n)} for n in range(5)]
+
+        created = client.post_batch('/things/bulk', items, chunk=2)
+
+        assert created == [{'id': n} for n in range(1, 6)]
+        assert [r.method for r in adapter.requests] == ['POST'] * 3
+        assert [json.loads(r.body) for r in adapter.requests] == [
+            {'items': items[0:2]},
+            {'items': items[2:4]},
+            {'items': items[4:5]},
+        ]
+
+    def test_delete_batch_chunks_ids(self, client):
+        """Test one DELETE per chunk with the ids joined in the query string."""
+        from urllib.parse import parse_qs, urlsplit
+
+        adapter = mount(client, [None, None])
+
+        client.delete_batch('/things/bulk', ['a', 'b', 'c'], chunk=2)
+
+        assert [r.method for r in adapter.requests] == ['DELETE'] * 2
+        assert [parse_qs(urlsplit(r.url).query) for r in adapter.requests] == [
+            {'ids': ['a,b']},
+            {'ids': ['c']},
+        ]
+
+
+class TestPagination:
+    """Tests for the generated client's paginate_iter."""
+
+    def test_prefetch_stops_at_total(self, client):
+        """Test that no page is requested past the reported total."""
+        adapter = mount(client, [
+            {'items': [1, 2], 'total': 4},
+            {'items': [3, 4], 'total': 4},
+        ])
+
+        assert client.paginate('/things', page_size=2) == [1, 2, 3, 4]
+        assert len(adapter.requests) == 2
+
+    def test_prefetch_stops_at_max_pages(self, client):
+        """Test that no page is requested past max_pages."""
+        adapter = mount(client, [{'items': [1, 2], 'total': 10}])
+
+        assert client.paginate('/things', page_size=2, max_pages=1) == [1, 2]
+        assert len(adapter.requests) == 1
+
+    def test_stopping_early_fetches_at_most_one_more_page(self, client):
+        """Test that abandoning the iterator leaves only the prefetched page."""
+        adapter = mount(client, [
+            {'items': [1, 2], 'total': 100},
+            {'items': [3, 4], 'total': 100},
+        ])
+
+        results = client.paginate_iter('/things', page_size=2)
+        assert next(results) == 1
+        results.close()
+
+        assert len(adapter.requests) <= 2
+
+    def test_caller_params_not_mutated(self, client):
+        """Test that paging parameters are not written into the caller's dict."""
+        mount(client, [{'items': [1], 'total': 1}])
+        params = {'filter': 'x'}
+
+        client.paginate('/things', params=params)
+
+        assert params == {'filter': 'x'}
+
+    def test_mixed_page_shapes(self, client):
+        """Test that a page with a different envelope is detected again."""
+        adapter = mount(client, [
+            {'items': [1, 2], 'total': 6},
+            {'data': [3, 4], 'total': 6},
+            {'items': [5, 6], 'total': 6},
+        ])
+
+        assert list(client.paginate_iter('/things', page_size=2)) == [1, 2, 3, 4, 5, 6]
+        assert len(adapter.requests) == 3
+
+    def test_cached_list_shape_rejects_dict_page(self, client):
+        """Test that a shape cached from a bare-list page is not applied to a dict."""
+        mount(client, [[1, 2], {'items': [3], 'total': 1}, 'unexpected'])
+
+        assert client.paginate('/things') == [1, 2]
+        assert client.paginate('/things') == [3]
+        assert client.paginate('/things') == []
+
+    def test_unrecognized_page_stops(self, client):
+        """Test that a page without results ends iteration."""
+        mount(client, [
+            {'items': [1, 2], 'total': 4},
+            {'error': 'rate limited'},
+        ])
+
+        assert list(client.paginate_iter('/things', page_size=2)) == [1, 2]
+
+
+class TestGetClient:
+    """Tests for the generated CLI's shared per-profile clients."""
+
+    def test_one_client_per_profile(self, api_env, monkeypatch):
+        """Test that subcommands share a client per profile, closed with the root."""
+        import click
+
+        cli = importlib.import_module(PKG + '.cli')
+        client_cls = importlib.import_module(PKG + '.client').MyApiClient
+        closed = []
+        monkeypatch.setattr(client_cls, 'close', lambda self: closed.append(self))
+
+        root = click.Context(cli.cli, obj={'profile': 'default', '_clients': {}})
+        with root:
+            sub = click.Context(cli.cli, parent=root)
+            other = click.Context(cli.cli, parent=root, obj={**root.obj, 'profile': 'dev'})
+
+            client = cli.get_client(sub)
+            assert cli.get_client(root) is client
+            assert cli.get_client(sub) is client
+
+            dev_client = cli.get_client(other)
+            assert dev_client is not client
+            assert cli.get_client(other) is dev_client
+            assert closed == []
+
+        assert closed == [dev_client, client]
+
+
+class TestResourceList:
+    """Tests for the generated resource list command."""
+
+    def test_json_output_streams_ndjson(self, server):
+        """Test that --limit sizes the single page and JSON is one object per line."""
+        from click.testing import CliRunner
+        from urllib.parse import parse_qs, urlsplit
+
+        things = [{'id': n, 'name': f'thing-{n}'} for n in range(3)]
+        server.replies.append((200, {'items': things, 'total': 10}))
+
+        result = CliRunner().invoke(
+            importlib.import_module(PKG + '.cli').cli, ['--output', 'json', 'resource', 'list', '--limit', '3']
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [json.loads(line) for line in result.output.splitlines()] == things
+        assert len(server.requests) == 1
+        assert parse_qs(urlsplit(server.requests[0][1]).query) == {
+            'limit': ['3'], 'offset': ['0'],
+        }
+
+
+class TestFormatters:
+    """Tests for the generated formatters' orjson fast path."""
+
+    @pytest.mark.parametrize('data', [
+        {1: 'one', 'two': 2},
+        {'big': 2 ** 70},
+    ])
+    def test_json_matches_stdlib(self, library, data):
+        """Test that orjson output matches json.dumps where orjson is stricter."""
+        pytest.importorskip('orjson')
+        formatters = importlib.import_module(PKG + '.formatters')
+
+        assert json.loads(formatters.format_json(data)) == json.loads(json.dumps(data))
+        assert formatters.format_json_line(data) == json.dumps(data, separators=(',', ':'))
+
+
+def tree(path):
+    """Map each file under path to its bytes."""
+    return {
+        str(file.relative_to(path)): file.read_bytes()
+        for file in Path(path).rglob('*') if file.is_file()
+    }
+
+
+class TestScaffoldLibrary:
+    """Tests for scaffold_library itself."""
+
+    def test_serial_writes_match_parallel(self, temp_path):
+        """Test that --no-parallel writes exactly what the thread pool writes."""
+        from scaffold_library import scaffold_library
+
+        results = []
+        for parallel in (True, False):
+            output_dir = temp_path / str(parallel)
+            output_dir.mkdir()
+            results.append(scaffold_library(
+                lib_name='my-api-lib', topic='my-api', api_name='My API',
+                output_dir=str(output_dir), parallel=parallel,
+            ))
+        threaded, serial = results
+
+        assert serial['files'] == threaded['files']
+        assert serial['directories'] == threaded['directories']
+        assert tree(serial['path']) == tree(threaded['path'])
+
+    def test_cli_no_parallel(self, temp_path):
+        """Test the --no-parallel flag, with the topic derived from --name."""
+        from scaffold_library import scaffold_library, main
+
+        (temp_path / "cli").mkdir()
+        (temp_path / "api").mkdir()
+        argv = ['scaffold_library.py', '--name', 'myapi-lib', '--api', 'My API',
+                '--output-dir', str(temp_path / "cli"), '--no-parallel']
+        with patch('sys.argv', argv), patch('scaffold_library.scaffold_library',
+                                            wraps=scaffold_library) as spy:
+            main()
+
+        assert spy.call_args.kwargs['parallel'] is False
+        assert spy.call_args.kwargs['topic'] == 'myapi'
+
+        expected = scaffold_library(
+            lib_name='myapi-lib', topic='myapi', api_name='My API',
+            output_dir=str(temp_path / "api"),
+        )
+        assert tree(temp_path / "cli" / "myapi-lib") == tree(expected['path'])
+
+    def test_dry_run_writes_nothing(self, temp_path):
+        """Test that a dry run reports the real run's files without creating any."""
+        from scaffold_library import scaffold_library
+
+        args = dict(lib_name='my-api-lib', topic='my-api', api_name='My API',
+                    output_dir=str(temp_path))
+        preview = scaffold_library(dry_run=True, **args)
+
+        assert list(temp_path.iterdir()) == []
+
+        result = scaffold_library(**args)
+        assert preview['files'] == result['files']
+        assert preview['directories'] == result['directories']
+
+    def test_existing_output_directory_is_rejected(self, temp_path):
+        """Test that an existing library directory is never written into."""
+        from scaffold_library import scaffold_library
+
+        existing = temp_path / "my-api-lib"
+        existing.mkdir()
+        (existing / "keep.txt").write_text("mine")
+
+        with pytest.raises(ValueError, match="Directory already exists"):
+            scaffold_library(lib_name='my-api-lib', topic='my-api', api_name='My API',
+                             output_dir=str(temp_path))
+
+        assert [p.name for p in existing.iterdir()] == ["keep.txt"]
+
+    @pytest.mark.parametrize('lib_name, topic', [
+        ('my-api-lib', 'my-api'),
+        ('jira-assistant-skills-lib', 'jira'),
+        ('libra-lib', 'libra'),
+        ('lib-tools', 'lib-tools'),
+        ('my-library', 'my-library'),
+    ])
+    def test_default_topic_strips_only_the_suffix(self, lib_name, topic):
+        """Test that only a trailing -lib or -assistant-skills-lib is dropped."""
+        from scaffold_library import _default_topic
+
+        assert _default_topic(lib_name) == topic
+
+    def test_clear_template_caches(self):
+        """Test that renders are memoized until the caches are cleared."""
+        from scaffold_library import generate_client_py, clear_template_caches, _format
+
+        context = {'LIB_NAME': 'my-api-lib', 'TOPIC': 'my-api', 'API_NAME': 'My API'}
+
+        first = generate_client_py(context)
+        assert generate_client_py(dict(context)) is first
+
+        clear_template_caches()
+        assert _format.cache_info().currsize == 0
+        again = generate_client_py(context)
+        assert again == first
+        assert again is not first
+
+
+class TestGenerators:
+    """Tests for the public generate_* functions."""
+
+    def test_minimal_context_matches_scaffold(self, temp_path):
+        """Test that generators derive missing names like the baseline did."""
+        from scaffold_library import scaffold_library, generate_client_py, generate_test_client_py
+
+        result = scaffold_library(
+            lib_name='my-api-lib', topic='my-api', api_name='My API', output_dir=str(temp_path)
+        )
+        src = Path(result['path']) / 'src' / PKG
+        context = {'LIB_NAME': 'my-api-lib', 'TOPIC': 'my-api', 'API_NAME': 'My API'}
+
+        assert generate_client_py(context) == (src / 'client.py').read_text()
+        assert context == {'LIB_NAME': 'my-api-lib', 'TOPIC': 'my-api', 'API_NAME': 'My API'}
+
+        # PKG_NAME keeps its meaning of package directory name
+        content = generate_test_client_py(dict(context, PKG_NAME=PKG))
+        assert f'from {PKG}.client import MyApiClient' in content
+
+    def test_pyproject_requires_urllib3_with_allowed_methods(self):
+        """Test that the generated client's Retry(allowed_methods=...) has its urllib3."""
+        from scaffold_library import generate_pyproject_toml
+
+        content = generate_pyproject_toml(
+            {'LIB_NAME': 'my-api-lib', 'TOPIC': 'my-api', 'API_NAME': 'My API'}
+        )
+
+        assert '"urllib3>=1.26",' in content
@@ -220,6 +220,76 @@ class TestScaffoldProject:
         lib_dirs = list(project_path.glob("*-assistant-skills-lib"))
         assert len(lib_dirs) > 0
 
+    def test_scaffold_fsync_matches_default(self, temp_path):
+        """Test that --fsync flushes every file and directory and writes the same project."""
+        import os
+        import scaffold_project
+        from scaffold_project import scaffold_project as scaffold_fn
+
+        def scaffold(output_dir, fsync):
+            output_dir.mkdir()
+            with patch('scaffold_project._fsync', wraps=scaffold_project._fsync) as fsync_spy:
+                result = scaffold_fn(
+                    name="My-Skills",
+                    topic="my",
+                    api_name="My API",
+                    project_type="hybrid",
+                    skills=["items", "users"],
+                    output_dir=str(output_dir),
+                    fsync=fsync
+                )
+            project_path = Path(result['path'])
+            tree = {
+                str(path.relative_to(project_path)): path.read_bytes()
+                for path in project_path.rglob('*') if path.is_file()
+            }
+            synced = {os.path.normpath(c.args[0]) for c in fsync_spy.call_args_list}
+            return result, tree, synced
+
+        default, default_tree, default_synced = scaffold(temp_path / "default", fsync=False)
+        synced, synced_tree, synced_paths = scaffold(temp_path / "synced", fsync=True)
+
+        assert synced_tree == default_tree
+        assert synced['files'] == default['files']
+        assert synced['directories'] == default['directories']
+        assert default_synced == set()
+
+        project_path = Path(synced['path'])
+        files = {str(project_path / name) for name in synced_tree}
+        assert files <= synced_paths
+        if os.name == 'posix':
+            # Every directory gaining an entry, up to the output directory
+            directories = {str(path) for path in project_path.rglob('*') if path.is_dir()}
+            directories.update({str(project_path), str(temp_path / "synced")})
+            assert synced_paths == files | directories
+
+    def test_generators_are_memoized(self):
+        """Test that repeat renders reuse the cached text until caches are cleared."""
+        from scaffold_project import generate_skill_md, clear_template_caches
+
+        context = {
+            "TOPIC": "github",
+            "PROJECT_NAME": "GitHub-Assistant-Skills",
+            "API_NAME": "GitHub",
+            "PROJECT_TYPE": "cli-wrapper",
+            "CLI_TOOL": "gh"
+        }
+
+        first = generate_skill_md(context, "issues")
+        assert generate_skill_md(dict(context), "issues") is first
+
+        clear_template_caches()
+        again = generate_skill_md(context, "issues")
+        assert again == first
+        assert again is not first
+
+    def test_template_caches_are_bounded(self):
+        """Test that caches keyed on caller-supplied values cannot grow without limit."""
+        from scaffold_project import _format, _skill_row
+
+        for cached in (_format, _skill_row):
+            assert cached.cache_info().maxsize is not None
+
 
 class TestValidation:
     """Tests for input validation in scaffold_project."""
@@ -144,6 +144,38 @@ class TestValidationOutput:
         if normal_result['warnings']:
             assert strict_result['valid'] is False
 
+    def test_parallel_matches_default(self, sample_project_new, capsys):
+        """Test that --parallel produces the same result and output as a serial run."""
+        import concurrent.futures
+        from unittest.mock import patch
+        from validate_project import run_validation, main
+
+        # Skills with different issues, so ordering differences would show
+        skills_dir = Path(sample_project_new) / "skills"
+        (skills_dir / "test-empty").mkdir()
+        embedded = skills_dir / "test-embedded"
+        (embedded / "scripts").mkdir(parents=True)
+        (embedded / "SKILL.md").write_text('---\nname: "test-embedded"\n---\n\n# Embedded\n')
+        (embedded / "scripts" / "run.py").write_text("print('hi')\n")
+
+        serial = run_validation(sample_project_new)
+        with patch('concurrent.futures.ThreadPoolExecutor',
+                   wraps=concurrent.futures.ThreadPoolExecutor) as pool:
+            parallel = run_validation(sample_project_new, parallel=True)
+
+        assert pool.called
+        assert parallel == serial
+        assert list(parallel['skills']) == list(serial['skills'])
+
+        outputs = []
+        for extra in ([], ['--parallel']):
+            with patch('sys.argv', ['validate_project.py', sample_project_new, '--format', 'json', *extra]):
+                with pytest.raises(SystemExit) as exit_info:
+                    main()
+            outputs.append((exit_info.value.code, capsys.readouterr().out))
+
+        assert outputs[0] == outputs[1]
+
     def test_detects_old_structure(self, sample_project):
         """Test that old structure is detected and flagged."""
         from validate_project import run_validation